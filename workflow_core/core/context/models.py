@@ -13,8 +13,7 @@
 # limitations under the License.
 
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
-import re
+from pydantic import BaseModel
 
 class Task(BaseModel):
     id: str
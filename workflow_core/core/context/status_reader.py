@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
 import re
 import shutil
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from workflow_core.core.context.models import Task, StatusFile
 from workflow_core.infrastructure.config.loader import FlowConfig
@@ -23,6 +24,11 @@ from workflow_core.infrastructure.logging import get_logger
 
 logger = get_logger("StatusReader")
 
+# Task line: "- [x] ID Name"; the mark is any one character so that invalid
+# marks reach the strict-mode check.
+# Groups: 1=indent, 2=mark, 3=id, 4=rest
+_TASK_LINE_RE = re.compile(r"^(\s*)- \[(.| )\] (\d+(?:\.\d+)*)\.?\s+(.*)")
+
 class StatusReaderError(Exception):
     pass
 
@@ -30,6 +36,8 @@ class StatusReader:
     def __init__(self, config: FlowConfig, root: Path):
         self.config = config
         self.root = root
+        # Last parse result, keyed by (path, blake2b digest of the content) it came from
+        self._parsed: Optional[Tuple[Tuple[str, bytes], StatusFile]] = None
         
     def find_status_file(self) -> Path:
         """
@@ -51,41 +59,55 @@ class StatusReader:
     def parse(self, file_path: Optional[Path] = None) -> StatusFile:
         """
         Parses the status file into a StatusFile model.
+        Unchanged content (by hash, not mtime) skips the scan; every caller
+        gets its own copy of the tasks.
         """
         target_path = file_path or self.find_status_file()
-        content = target_path.read_text(encoding='utf-8')
-        lines = content.splitlines()
+        raw = target_path.read_bytes()
+        key = (str(target_path), hashlib.blake2b(raw, digest_size=16).digest())
+        if not (self._parsed and self._parsed[0] == key):
+            tasks = self._scan_tasks(raw.decode('utf-8'))
+            self._parsed = (key, StatusFile(tasks=tasks, file_path=str(target_path)))
+
+        # Task fields are immutable values, so a per-task copy is a full copy
+        cached = self._parsed[1]
+        return StatusFile.model_construct(
+            tasks=[task.model_copy() for task in cached.tasks], file_path=cached.file_path
+        )
 
+    def _scan_tasks(self, content: str) -> List[Task]:
+        """
+        Extracts tasks from the file content, one match per line (str.splitlines
+        line breaks, so CRLF and other separators split like in any editor).
+        """
         tasks: List[Task] = []
         seen_ids = set()
-        
-        # Regex: "- [x] ID Name"
-        # Groups: 1=indent, 2=mark, 3=id, 4=rest
-        task_pattern = re.compile(r"^(\s*)- \[(.| )\] (\d+(?:\.\d+)*)\.?\s+(.*)")
 
-        for i, line in enumerate(lines):
-            match = task_pattern.match(line)
-            if match:
-                indent, mark, task_id, rest = match.groups()
-                
-                if task_id in seen_ids:
-                    raise StatusReaderError(f"Duplicate Task ID '{task_id}' on line {i+1}")
-                seen_ids.add(task_id)
-                
-                # Strict Mark Check
-                if mark not in [' ', 'x', '/']:
-                    if self.config.strict_mode:
-                        raise StatusReaderError(f"Invalid Task Mark '{mark}' on line {i+1}. Allowed: [ ], [x], [/]")
-                
-                tasks.append(Task(
-                    id=task_id,
-                    name=rest.strip(),
-                    mark=mark, # type: ignore
-                    indentation=indent,
-                    line_number=i+1
-                ))
+        for line_num, line in enumerate(content.splitlines(), 1):
+            match = _TASK_LINE_RE.match(line)
+            if not match:
+                continue
+
+            indent, mark, task_id, rest = match.groups()
+
+            if task_id in seen_ids:
+                raise StatusReaderError(f"Duplicate Task ID '{task_id}' on line {line_num}")
+            seen_ids.add(task_id)
+            
+            # Strict Mark Check
+            if mark not in [' ', 'x', '/']:
+                if self.config.strict_mode:
+                    raise StatusReaderError(f"Invalid Task Mark '{mark}' on line {line_num}. Allowed: [ ], [x], [/]")
+            
+            tasks.append(Task(
+                id=task_id,
+                name=rest.strip(),
+                mark=mark, # type: ignore
+                indentation=indent,
+                line_number=line_num
+            ))
                 
-        return StatusFile(tasks=tasks, file_path=str(target_path))
+        return tasks
 
     def save_backup(self, file_path: Path):
         """
@@ -111,55 +133,53 @@ class StatusReader:
         """
         Updates a specific task's status in the file (Token replacement).
         """
-        self.save_backup(file_path)
-        
-        content = file_path.read_text(encoding='utf-8')
-        lines = content.splitlines()
+        return self.update_status_bulk(file_path, {task_id: new_mark})
+
+    def update_status_bulk(self, file_path: Path, updates: Dict[str, str]) -> bool:
+        """
+        Applies several mark changes (task_id -> new_mark) in one pass.
+        The backup is rotated once and the file written once, and only if a line changed.
+        """
+        if not updates:
+            return False
+
+        lines = file_path.read_text(encoding='utf-8').splitlines()
+        pending = dict(updates)
         updated = False
-        
-        escaped_id = re.escape(task_id)
-        # We need to match the exact line to ensure we don't just replace the first string occurrence logic
-        pattern = re.compile(rf"^(\s*)- \[(.| )\] {escaped_id}(\.?)\s+(.*)")
-        
-        new_lines = []
-        for line in lines:
-            match = pattern.match(line)
-            if match and not updated:
-                 # Reconstruct line with new mark
-                 # Groups: 1=indent, 2=old_mark, 3, 4
-                 indent = match.group(1)
-                 rest = line[len(match.group(0)):] # Actually match.group(0) is full match? No.
-                 # Using replace on the line is safer if we confirmed the match
-                 # But we must be careful with "[ ]" vs "[x]"
-                 
-                 # Let's rebuild it cleanly
-                 # "- [MARK] ID. Name"
-                 # NOTE: The regex captured (dot?) after ID and (rest) name.
-                 # Let's just swap the [char] part.
-                 
-                 # Pattern for exactly the bracket part:
-                 # Replace only the first occurrence of `[` + match.group(2) + `]` with `[` + new_mark + `]`
-                 # But we need to be safe.
-                 
-                 # prefix_len: indent (N) + "- [" (3 characters)
-                 prefix_len = len(indent) + 3
-                 # line[prefix_len] is the mark char
-                 
-                 if line[prefix_len] == match.group(2):
-                      new_line = line[:prefix_len] + new_mark + line[prefix_len+1:]
-                      new_lines.append(new_line)
-                      updated = True
-                 else:
-                      # Falback
-                      logger.warning(f"Regex mismatch during update for line: {line}")
-                      new_lines.append(line)
-            else:
-                new_lines.append(line)
-                
-        if updated:
-            file_path.write_text("\n".join(new_lines), encoding='utf-8')
-            return True
-        return False
+
+        # Rigid line format: INDENT- [MARK] ID(.) NAME
+        # Plain string slicing is enough, no regex needed.
+        for i, line in enumerate(lines):
+            if not pending:
+                break
+            stripped = line.lstrip()
+            if not stripped.startswith("- [") or stripped[4:6] != "] ":
+                continue
+
+            # ID must be followed by whitespace (the name separator)
+            head = stripped[6:].split(None, 1)
+            if not head or len(stripped) == 6 + len(head[0]):
+                continue
+            task_id = head[0][:-1] if head[0].endswith(".") else head[0]
+            if task_id not in pending:
+                continue
+
+            # Only the first occurrence of an ID is updated
+            new_mark = pending.pop(task_id)
+
+            # prefix_len: indent (N) + "- [" (3 characters)
+            # line[prefix_len] is the mark char
+            prefix_len = len(line) - len(stripped) + 3
+            lines[i] = line[:prefix_len] + new_mark + line[prefix_len+1:]
+            updated = True
+
+        if not updated:
+            return False
+
+        # Bulk Rewrite to avoid N backup rotations
+        self.save_backup(file_path)
+        file_path.write_text("\n".join(lines), encoding='utf-8')
+        return True
 
     def cascade_completion(self, file_path: Optional[Path] = None) -> bool:
         """
@@ -170,110 +190,50 @@ class StatusReader:
         status = self.parse(target_path)
         tasks = status.tasks
         
-        # 1. Build Tree
-        # Simple Node structure
-        class Node:
-            def __init__(self, t):
-                self.task = t
-                self.children = []
-                self.parent = None
-        
-        nodes = [Node(t) for t in tasks]
-        root_dummy = Node(Task(id="ROOT", name="ROOT", mark=" ", indentation=""))
-        # Indentation logic: We assume standard 4 or 2 spaces. 
-        # Actually comparing length is sufficient?
-        # Stack of active parents
-        stack = [root_dummy]
-        
-        for node in nodes:
-            current_indent = len(node.task.indentation)
-            
+        # 1. Build Tree (index arrays instead of node objects)
+        # parent[i] is the index of the task's parent, -1 for top-level tasks.
+        # Indentation logic: comparing length is sufficient.
+        n = len(tasks)
+        parent = [-1] * n
+        stack = [] # (index, indent) of active parents
+
+        for i, t in enumerate(tasks):
+            current_indent = len(t.indentation)
+
             # Pop stack while top has deeper or equal indentation
-            while len(stack) > 1:
-                top_indent = len(stack[-1].task.indentation)
-                if current_indent <= top_indent:
-                    stack.pop()
-                else:
-                    break
-            
-            parent = stack[-1]
-            parent.children.append(node)
-            node.parent = parent
-            stack.append(node)
-            
-        # 2. Iterate Bottom-Up (Post-Order) to propagate completion
-        # We can just iterate the list of nodes efficiently?
-        # If we iterate tasks in REVERSE order, we process children before parents?
-        # Yes, because children appear after parents in file.
-        
+            while stack and current_indent <= stack[-1][1]:
+                stack.pop()
+
+            if stack:
+                parent[i] = stack[-1][0]
+            stack.append((i, current_indent))
+
+        children_total = [0] * n
+        children_done = [0] * n
+        for i, t in enumerate(tasks):
+            p = parent[i]
+            if p >= 0:
+                children_total[p] += 1
+                if t.mark == 'x':
+                    children_done[p] += 1
+
+        # 2. Iterate Bottom-Up to propagate completion
+        # Children appear after parents in file, so a reverse pass
+        # settles every child before its parent is checked.
         changes = []
-        reversed_nodes = list(reversed(nodes))
-        
-        for node in reversed_nodes:
-            if not node.children:
+        for i in range(n - 1, -1, -1):
+            if not children_total[i] or children_done[i] != children_total[i]:
                 continue
-                
-            # It's a parent. Check children.
-            all_done = all(child.task.mark == 'x' for child in node.children)
-            
-            if all_done:
-                if node.task.mark != 'x':
-                    logger.info(f"Auto-Completing Parent Task: {node.task.id}")
-                    node.task.mark = 'x'
-                    changes.append(node.task)
-        
+
+            t = tasks[i]
+            if t.mark != 'x':
+                logger.info(f"Auto-Completing Parent Task: {t.id}")
+                changes.append(t.id)
+                if parent[i] >= 0:
+                    children_done[parent[i]] += 1
+
         # 3. Apply Changes
         if not changes:
             return False
-            
-        # Bulk Rewrite to avoid N backup rotations
-        self.save_backup(target_path)
-        
-        # Reconstruct Content
-        # We rely on the modified 'nodes' list (in original order)
-        new_lines = []
-        for node in nodes:
-            t = node.task
-            # Reconstruct line: INDENT- [MARK] ID. NAME
-            # Logic from update_status match breakdown:
-            # But here we construct scratch?
-            # Safer to modify original lines? 
-            # We have line_number. But multiple changes shifts nothing?
-            # Actually, let's use the exact parsing logic to reconstruct format.
-            # "    - [ ] 1. Foo"
-            # t.indentation + "- [" + t.mark + "] " + t.id + (". " if needed?) + t.name
-            
-            # CAUTION: The regex parsing stripped things. The name might have lost spacing?
-            # t.name was match.group(4).strip(). 
-            # If original line had extra spaces, we lose them. 
-            # Ideally we patch lines by line_number.
-            pass
-        
-        # Patching Approach
-        content = target_path.read_text(encoding='utf-8').splitlines()
-        for t in changes:
-            # line_number is 1-indexed
-            idx = t.line_number - 1
-            line = content[idx]
-            # Replace [ ] or [/] with [x]
-            # Careful with regex again or index
-            # Known structure: indent + "- [" + mark + "]"
-            # prefix_len calculation again
-            indent_len = len(t.indentation)
-            mark_index = indent_len + 3 # indent(N) + "- [" (3)
-            
-            # Verify correctness
-            if line[mark_index-1:mark_index+2] == f"[{t.mark}]": 
-                 # Wait, 't.mark' is already 'x' in our object, but file line is old.
-                 # We need to find the old mark in the line.
-                 pass
-            
-            # Just force inject 'x' at calculated position
-            # Verify structure matches expectation
-            if line[indent_len:indent_len+3] == "- [":
-                 content[idx] = line[:mark_index] + "x" + line[mark_index+1:]
-            else:
-                 logger.warning(f"Line mismatch during cascade write for {t.id}: {line}")
-        
-        target_path.write_text("\n".join(content), encoding='utf-8')
-        return True
+
+        return self.update_status_bulk(target_path, {task_id: 'x' for task_id in changes})
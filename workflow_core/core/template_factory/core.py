@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple, FrozenSet
 from pathlib import Path
 
 @dataclass
@@ -29,6 +29,8 @@ class ReviewContext:
 class TemplateFactory:
     def __init__(self, config_root: Optional[Path] = None):
         self.modules = []
+        # (service_type, language, tags) -> indices into self.modules
+        self._active_cache: Dict[Tuple[str, str, FrozenSet[str]], Tuple[int, ...]] = {}
         if config_root:
             self.load_modules(config_root)
         else:
@@ -51,15 +53,25 @@ class TemplateFactory:
             try:
                 data = json.loads(m_file.read_text(encoding="utf-8"))
                 self.modules = data.get("Modules", [])
+                self._active_cache.clear()
             except Exception as e:
                 print(f"Error loading modules.json: {e}")
 
     def get_active_modules(self, context: ReviewContext) -> List[Dict[str, Any]]:
         """
         Returns a list of modules that apply to the current context.
+        Filtering only depends on (service_type, language, tags), so it is memoized per key.
         """
+        key = (context.service_type, context.language, frozenset(context.tags))
+        indices = self._active_cache.get(key)
+        if indices is None:
+            indices = self._filter_active(*key)
+            self._active_cache[key] = indices
+        return [self.modules[i] for i in indices]
+
+    def _filter_active(self, service_type: str, language: str, tags: FrozenSet[str]) -> Tuple[int, ...]:
         active = []
-        for m in self.modules:
+        for idx, m in enumerate(self.modules):
             # Check Triggers
             triggers = m.get("Trigger", {})
             
@@ -67,22 +79,22 @@ class TemplateFactory:
             if "Type" in triggers:
                 # triggers["Type"] can be list or string
                 types = triggers["Type"] if isinstance(triggers["Type"], list) else [triggers["Type"]]
-                if context.service_type not in types:
+                if service_type not in types:
                     continue
             
             # 2. Tag Match
             if "Tags" in triggers:
                req_tags = set(triggers["Tags"])
-               if not req_tags.intersection(context.tags):
+               if not req_tags.intersection(tags):
                    continue
                    
             # 3. Language Match
             if "Language" in triggers:
-                if context.language != triggers["Language"]:
+                if language != triggers["Language"]:
                     continue
             
-            active.append(m)
-        return active
+            active.append(idx)
+        return tuple(active)
 
     def generate_from_modules(self, modules: List[Dict[str, Any]], context: ReviewContext, data: Dict[str, Any]) -> str:
         parts = []
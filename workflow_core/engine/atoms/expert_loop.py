@@ -12,9 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Union
 from workflow_core.engine.atoms import prompt, agent
 
+# Upper bound for concurrent agent queries in research mode
+MAX_PARALLEL_QUERIES = 8
+
+# Review verdict counts as blocking if it leaves an open checkbox or rejects
+_BLOCK_RE = re.compile(r"\[ \]|Reject")
+
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Iterates through experts, prompting the agent for each, and aggregating results.
@@ -27,7 +35,20 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     
     results = {}
     blocked = False
-    
+
+    # Research answers are order-independent: agent queries are pure I/O,
+    # so dispatch them concurrently instead of paying N round-trips.
+    if mode == "research" and len(experts) > 1:
+        prompts = []
+        for expert_role in experts:
+            iteration_ctx = loop_context.copy()
+            iteration_ctx["role"] = expert_role
+            prompts.append(prompt.render_string(str(prompt_template), iteration_ctx))
+
+        workers = min(len(experts), MAX_PARALLEL_QUERIES)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            responses = list(pool.map(agent.query, prompts))
+        return {"results": dict(zip(experts, responses))}
 
     for expert_role in experts:
         # 1. Prepare Context (Inject Role)
@@ -51,8 +72,9 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         
         # 4. Logic for Review Mode
         if mode == "review":
-            if "[ ]" in response or "Reject" in response:
+            if _BLOCK_RE.search(response):
                 blocked = True
+                break # Gate already failed, skip remaining experts
 
     if mode == "review":
         return {
@@ -14,23 +14,29 @@
 
 from typing import Dict, Any, List, Set, Optional
 from pathlib import Path
-import json
-from workflow_core.core.template_factory.core import TemplateFactory, ReviewContext
+import os
+import re
+from workflow_core.core.template_factory.core import ReviewContext
 from workflow_core.engine.atoms import agent, prompt
+from workflow_core.engine.atoms.render_template import get_factory
+from workflow_core.infrastructure.config.json_cache import load_json_cached
+
+# Holds core_teams.json / expert_personas.json
+_CONFIG_ROOT = Path(__file__).parent.parent.parent / "config"
+
+# "### Reviewer: <Role>" section headers injected in review mode
+_HDR_RE = re.compile(r"^### Reviewer: (.+)$", re.MULTILINE)
+
+# Checked approval box in a reviewer's section
+_APPROVE_RE = re.compile(r"\[x\]\s*APPROVE")
 
 def _load_teams_config(config_root: Path) -> Dict[str, Any]:
     """Loads the core_teams.json configuration."""
-    teams_file = config_root / "core_teams.json"
-    if not teams_file.exists():
-        return {}
-    return json.loads(teams_file.read_text(encoding="utf-8"))
+    return load_json_cached(config_root / "core_teams.json", {})
 
 def _load_personas(config_root: Path) -> Dict[str, Any]:
     """Loads the expert_personas.json configuration."""
-    p_file = config_root / "expert_personas.json"
-    if not p_file.exists():
-        return {}
-    return json.loads(p_file.read_text(encoding="utf-8"))
+    return load_json_cached(config_root / "expert_personas.json", {})
 
 def _resolve_experts(factory_modules: List[Dict[str, Any]], expert_set_name: Optional[str], teams_config: Dict[str, Any], context: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
@@ -69,7 +75,7 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         target_path = Path.cwd() / target_path
     
     # 1. Initialize Context & Factory
-    factory = TemplateFactory()
+    factory = get_factory()
     r_ctx = ReviewContext(
         task_id=context.get("task_id", "0.0.0"),
         task_type="Impl.Feature", 
@@ -81,9 +87,8 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     )
 
     # 2. Get Experts
-    config_root = Path(__file__).parent.parent.parent / "config"
-    teams_config = _load_teams_config(config_root)
-    personas_config = _load_personas(config_root)
+    teams_config = _load_teams_config(_CONFIG_ROOT)
+    personas_config = _load_personas(_CONFIG_ROOT)
     
     all_active_modules = factory.get_active_modules(r_ctx)
     expert_set_name = args.get("expert_set")
@@ -99,51 +104,61 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         prompt_template = args.get("prompt_template")
         updated_any = False
         
-        for expert in required_experts:
-            role = expert.get("Role")
-            header = f"## {role} Analysis"
-            
-            if header in content:
-                continue # Already done
-            
-            # 1. Write Header
-            content += f"\n\n{header}\n"
-            target_path.write_text(content, encoding="utf-8")
-            
-            # 2. Prepare Prompt
-            prompt_ctx = context.copy()
-            prompt_ctx.update({
-                "role": role,
-                "persona": personas_config.get(role, {}),
-                "current_content": content # Give agent the full file so far
-            })
-            
-            # Simple Template Loading logic (Hack for MVP)
-            p_tmpl_content = prompt_template
-            if prompt_template and str(prompt_template).endswith(".j2"):
-                 # Try to load if absolute path or exists
-                 p_path = Path(prompt_template)
-                 if p_path.exists():
-                     p_tmpl_content = p_path.read_text(encoding="utf-8")
-            
-            # 3. Render & Query
-            # We use prompt.render_string even if it's simple text
-            final_prompt = prompt.render_string(str(p_tmpl_content), prompt_ctx)
-            
-            response = agent.query(final_prompt)
+        # Simple Template Loading logic (Hack for MVP)
+        p_tmpl_content = prompt_template
+        if prompt_template and str(prompt_template).endswith(".j2"):
+             # Try to load if absolute path or exists
+             p_path = Path(prompt_template)
+             if p_path.exists():
+                 p_tmpl_content = p_path.read_text(encoding="utf-8")
+        
+        # Append-only: keep one descriptor open and write each expert's
+        # header + response with a single vectored write.
+        fd = os.open(target_path, os.O_WRONLY | os.O_APPEND)
+        try:
+            for expert in required_experts:
+                role = expert.get("Role")
+                header = f"## {role} Analysis"
+                
+                if header in content:
+                    continue # Already done
+                
+                # 1. Header (written together with the result)
+                content += f"\n\n{header}\n"
+                
+                # 2. Prepare Prompt
+                prompt_ctx = context.copy()
+                prompt_ctx.update({
+                    "role": role,
+                    "persona": personas_config.get(role, {}),
+                    "current_content": content # Give agent the full file so far
+                })
+                
+                # 3. Render & Query
+                # We use prompt.render_string even if it's simple text
+                final_prompt = prompt.render_string(str(p_tmpl_content), prompt_ctx)
+                
+                response = agent.query(final_prompt)
+                
+                # 4. Append Header + Result
+                content += f"\n{response}\n"
+                _append(fd, [f"\n\n{header}\n", f"\n{response}\n"])
+                updated_any = True
             
-            # 4. Append Result
-            content += f"\n{response}\n"
-            target_path.write_text(content, encoding="utf-8")
-            updated_any = True
+            if updated_any:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
             
         return {"status": "DONE", "message": "Drafting Complete"}
 
     # --- REVIEW MODE (Approval Gates) ---
+    # Collect injected reviewers in one sweep instead of a substring scan per expert
+    seen_reviewers = {m.group(1).strip() for m in _HDR_RE.finditer(content)}
     last_expert_index = -1
     for idx, expert in enumerate(required_experts):
         role_name = expert.get("Role", expert.get("Name"))
-        if f"### Reviewer: {role_name}" in content:
+        if role_name in seen_reviewers:
             last_expert_index = idx
         else:
             break
@@ -160,9 +175,11 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     last_expert = required_experts[last_expert_index]
     last_role = last_expert.get("Role")
     expert_header = f"### Reviewer: {last_role}"
-    segment = content.split(expert_header)[-1]
+    # Search the tail after the last occurrence of the header in place (no slice copy)
+    pos = content.rfind(expert_header)
+    start = pos + len(expert_header) if pos >= 0 else 0
     
-    if "[x] APPROVE" not in segment:
+    if _APPROVE_RE.search(content, start) is None:
         return _build_waiting_msg(last_expert, personas_config, f"Waiting for Approval from {last_role}")
     
     # Case C: Inject Next
@@ -186,6 +203,21 @@ def _build_waiting_msg(expert_mod, personas, base_msg, error=False):
     return {"status": "WAITING", "message": msg}
 
 def _inject_expert(factory, expert_mod, ctx, path, current_content):
+    # `current_content` is what is already on disk, so appending is enough
     rendered = factory._render_module(expert_mod, ctx, {})
-    new_content = current_content + "\n\n" + rendered
-    path.write_text(new_content, encoding="utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+    try:
+        _append(fd, ["\n\n", rendered])
+    finally:
+        os.close(fd)
+
+def _append(fd: int, parts: List[str]):
+    """Appends text parts to an O_APPEND descriptor in one vectored write (plain write where writev is missing)."""
+    buffers = [p.encode("utf-8") for p in parts]
+    total = sum(len(b) for b in buffers)
+    written = os.writev(fd, buffers) if hasattr(os, "writev") else 0
+    if written < total:
+        # Short write (or no writev): finish with plain writes
+        rest = b"".join(buffers)[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
@@ -12,10 +12,55 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import shlex
 import subprocess
-from typing import Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+from workflow_core.engine.core.executor import current_cwd
+
+# Exit codes of the chained git script, used to tell which step failed
+_COMMIT_FAILED = 2
+_PUSH_FAILED = 3
+
+# Background pushes for "commit_push": the local commit gates correctness,
+# the network round-trip does not need to block the workflow. One worker keeps
+# pushes in commit order; failures fail the workflow at teardown (finalize()).
+_PUSH_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git-push")
+_PENDING_PUSHES: List[Future] = []
+
+def _git(argv: List[str], capture: bool = False, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+    """
+    Runs a command with binary pipes. stdout is only collected when `capture`
+    is set; stderr is kept raw and decoded on demand via _stderr().
+    """
+    return subprocess.run(
+        argv,
+        cwd=cwd,
+        stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False
+    )
+
+def _stderr(res: subprocess.CompletedProcess) -> str:
+    return res.stderr.decode("utf-8", "replace") if res.returncode else ""
+
+def _push(cwd: str) -> subprocess.CompletedProcess:
+    return _git(["git", "push"], cwd=cwd)
+
+def finalize() -> List[str]:
+    """
+    Waits for background pushes to finish.
+    Returns an error message per failed push.
+    """
+    errors = []
+    while _PENDING_PUSHES:
+        res = _PENDING_PUSHES.pop(0).result()
+        if res.returncode != 0:
+            errors.append(f"Git push failed: {_stderr(res).strip()}")
+    return errors
+
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Executes Git operations.
@@ -31,36 +76,37 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     if action not in ["commit", "push", "commit_push", "status"]:
         return {"status": "FAILED", "message": f"Unknown Git Action: {action}"}
 
-    # Helper to run git
-    def git(*cmd_args):
-        return subprocess.run(
-            ["git"] + list(cmd_args),
-            capture_output=True,
-            text=True,
-            check=False
-        )
-
+    cwd = str(current_cwd())
     if action == "status":
-        res = git("status")
-        return {"status": "DONE", "stdout": res.stdout}
+        res = _git(["git", "status"], capture=True, cwd=cwd)
+        return {"status": "DONE", "stdout": res.stdout.decode("utf-8", "replace")}
 
+    # Chain add/commit/push into a single shell invocation instead of one
+    # subprocess per git command. Every argument is shell-quoted.
+    script: List[str] = []
     if action in ["commit", "commit_push"]:
-        # Add
-        if isinstance(files, list):
-            git("add", *files)
-        else:
-            git("add", files)
-            
-        # Commit
+        paths = files if isinstance(files, list) else [files]
+        # No config overrides: git's index extensions follow the repository's settings
+        script.append("git add -- " + " ".join(shlex.quote(str(p)) for p in paths))
         # TODO: Inject Signed logic if needed
-        res = git("commit", "-m", message)
-        if res.returncode != 0 and "nothing to commit" not in res.stdout:
-             return {"status": "FAILED", "message": "Commit Failed", "stderr": res.stderr}
+        # "nothing to commit" (empty index) is not a failure
+        script.append(
+            f"git commit -m {shlex.quote(message)} || git diff --cached --quiet || exit {_COMMIT_FAILED}"
+        )
         
-    if action in ["push", "commit_push"]:
-        # Push
-        res = git("push")
-        if res.returncode != 0:
-            return {"status": "FAILED", "message": "Push Failed", "stderr": res.stderr}
+    if action == "push":
+        script.append(f"git push || exit {_PUSH_FAILED}")
+
+    res = _git(["sh", "-c", "\n".join(script)], cwd=cwd)
+
+    if res.returncode == _COMMIT_FAILED:
+        return {"status": "FAILED", "message": "Commit Failed", "stderr": _stderr(res)}
+    if res.returncode == _PUSH_FAILED:
+        return {"status": "FAILED", "message": "Push Failed", "stderr": _stderr(res)}
+
+    if action == "commit_push":
+        # Overlap the push with the rest of the workflow; see finalize()
+        _PENDING_PUSHES.append(_PUSH_POOL.submit(_push, cwd))
+        return {"status": "DONE", "message": "Git commit completed, push running in background."}
 
     return {"status": "DONE", "message": f"Git {action} completed."}
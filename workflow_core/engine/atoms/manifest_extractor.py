@@ -12,16 +12,54 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import mmap
 import re
 import sys
 import json
 import logging
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('ManifestExtractor')
 
+# Patterns run over the mmap'd UTF-8 bytes; only captured groups are decoded.
+# End of a feature block: the next "## <n>." header, whatever follows the dot
+_BLOCK_END_RE = re.compile(rb'^##\s+\d+\.', re.MULTILINE)
+
+# Bold key fields inside a feature block, e.g. "**Complexity**: High"
+_BOLD_FIELD_RE = re.compile(rb'\*\*(Complexity|Feature|Customer Benefit|Scope \(In\))\*\*:\s*(.*)')
+
+@functools.lru_cache(maxsize=64)
+def _header_re(feature_seq: str) -> "re.Pattern[bytes]":
+    """Header of one feature: "## <Seq>. <Name>" (e.g. "## 1. Feature Name"), compiled once per Seq."""
+    return re.compile(rb'^##\s+' + re.escape(feature_seq.encode("utf-8")) + rb'\.\s+(.*?)\s*$', re.MULTILINE)
+
+def _find_feature(content, feature_seq: str) -> Optional[Tuple[str, Dict[str, str]]]:
+    """
+    Returns (feature_title, bold fields) for the feature block in a bytes-like buffer,
+    or None if its header is missing.
+    """
+    match = _header_re(feature_seq).search(content)
+    if not match:
+        return None
+    
+    # The block runs until the next "## <n>." or end of file
+    next_header_match = _BLOCK_END_RE.search(content, match.end())
+    block_end = next_header_match.start() if next_header_match else len(content)
+    
+    # Extract key fields from the block in one pass (first occurrence wins)
+    # **Complexity**: ...
+    # **Feature**: ... (This is the Goal)
+    # **Customer Benefit**: ... (This is the Context)
+    fields: Dict[str, str] = {}
+    for m in _BOLD_FIELD_RE.finditer(content, match.end(), block_end):
+        fields.setdefault(m.group(1).decode("utf-8"), m.group(2).decode("utf-8").strip())
+    
+    return match.group(1).decode("utf-8").strip(), fields
+
 def extract_feature_info(project_map_path: str, feature_seq: str):
     """
     Parses project_map.md to find a feature by its Sequence ID (e.g. "0", "1").
@@ -32,47 +70,27 @@ def extract_feature_info(project_map_path: str, feature_seq: str):
         logger.error(f"Project Map not found at: {path}")
         sys.exit(1)
         
-    content = path.read_text('utf-8')
-    
-    # Regex to find the header: "## 1. Feature Name" or "## 0. Feature Name"
-    # Matches: ## <Seq>. <Name>
-    header_pattern = re.compile(r'^##\s+' + re.escape(feature_seq) + r'\.\s+(.*?)\s*$', re.MULTILINE)
-    match = header_pattern.search(content)
+    with path.open("rb") as fh:
+        if fh.seek(0, 2) == 0:
+            found = None
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                found = _find_feature(content, feature_seq)
     
-    if not match:
+    if not found:
         logger.error(f"Feature Sequence '{feature_seq}' not found in Project Map.")
         sys.exit(2)
         
-    feature_title = match.group(1).strip()
-    
-    # Extract the block until the next "## " or end of file
-    start_idx = match.end()
-    rest_of_file = content[start_idx:]
-    next_header_match = re.search(r'^##\s+\d+\.', rest_of_file, re.MULTILINE)
-    
-    if next_header_match:
-        block_content = rest_of_file[:next_header_match.start()]
-    else:
-        block_content = rest_of_file
-        
-    # Extract key fields from the block
-    # **Complexity**: ...
-    # **Feature**: ... (This is the Goal)
-    # **Customer Benefit**: ... (This is the Context)
-    
-    complexity_match = re.search(r'\*\*Complexity\*\*:\s*(.*)', block_content)
-    feature_def_match = re.search(r'\*\*Feature\*\*:\s*(.*)', block_content)
-    benefit_match = re.search(r'\*\*Customer Benefit\*\*:\s*(.*)', block_content)
-    scope_in_match = re.search(r'\*\*Scope \(In\)\*\*:\s*(.*)', block_content)
+    feature_title, fields = found
     
     info = {
         "feature_seq": feature_seq,
         "feature_name": feature_title.lower().replace(" ", "_").replace(":", "").replace("__", "_"), 
         "feature_title": feature_title,
-        "complexity": complexity_match.group(1).strip() if complexity_match else "Unknown",
-        "feature_goal": feature_def_match.group(1).strip() if feature_def_match else "Defined in Project Map",
-        "feature_context": benefit_match.group(1).strip() if benefit_match else "See Project Map",
-        "scope_in": scope_in_match.group(1).strip() if scope_in_match else ""
+        "complexity": fields.get("Complexity", "Unknown"),
+        "feature_goal": fields.get("Feature", "Defined in Project Map"),
+        "feature_context": fields.get("Customer Benefit", "See Project Map"),
+        "scope_in": fields.get("Scope (In)", "")
     }
     
     return info
@@ -87,12 +105,10 @@ if __name__ == "__main__":
     
     data = extract_feature_info(pmap_path, seq_id)
     
-    # Output metrics for Flow Manager to capture
-    print(f"::set-output name=feature_name::{data['feature_name']}")
-    print(f"::set-output name=feature_title::{data['feature_title']}")
-    print(f"::set-output name=feature_goal::{data['feature_goal']}")
-    print(f"::set-output name=feature_context::{data['feature_context']}")
-    print(f"::set-output name=complexity::{data['complexity']}")
+    # Output metrics for Flow Manager to capture (one write for all records)
+    outputs = ("feature_name", "feature_title", "feature_goal", "feature_context", "complexity")
+    sys.stdout.write("".join(f"::set-output name={key}::{data[key]}\n" for key in outputs))
+    sys.stdout.flush()
     
     # Also dump json for debug
     logger.info(json.dumps(data, indent=2))
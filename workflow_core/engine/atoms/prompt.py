@@ -12,25 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 from pathlib import Path
 from typing import Dict, Any, Union
 import jinja2
 
+# Shared environments: building one per render throws away Jinja's template caches.
+_ENV = jinja2.Environment(autoescape=False)
+_FILE_ENVS: Dict[str, jinja2.Environment] = {}
+
+# Sources above this size are compiled without caching to bound memory
+MAX_CACHED_TEMPLATE_SIZE = 64 * 1024
+
+@functools.lru_cache(maxsize=256)
+def _compile(source: str) -> jinja2.Template:
+    """Compiles a template string once per distinct source."""
+    return _ENV.from_string(source)
+
+def _get_file_env(template_dir: Path) -> jinja2.Environment:
+    """Returns the (cached) FileSystemLoader environment for a template directory."""
+    key = str(template_dir)
+    env = _FILE_ENVS.get(key)
+    if env is None:
+        env = jinja2.Environment(
+            loader=jinja2.FileSystemLoader(key),
+            autoescape=False
+        )
+        _FILE_ENVS[key] = env
+    return env
+
 def render_string(template_string: str, context: Dict[str, Any]) -> str:
     """Renders a Jinja2 template string."""
-    env = jinja2.Environment(autoescape=False)
-    tpl = env.from_string(template_string)
-    return tpl.render(**context)
+    if len(template_string) > MAX_CACHED_TEMPLATE_SIZE:
+        return _ENV.from_string(template_string).render(**context)
+    return _compile(template_string).render(**context)
 
 def render_file(template_path: Path, context: Dict[str, Any]) -> str:
     """Renders a Jinja2 template file."""
     # We use FileSystemLoader to support inheritance if needed, 
     # but for simple atom we can just read text if we want isolation.
     # To support Extends/Include, we need a Loader.
-    
-    env = jinja2.Environment(
-        loader=jinja2.FileSystemLoader(str(template_path.parent)),
-        autoescape=False
-    )
+    # The loader-backed environment caches compiled templates and reloads them on mtime change.
+    env = _get_file_env(template_path.parent)
     tpl = env.get_template(template_path.name)
     return tpl.render(**context)
@@ -12,10 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
+import os
 from workflow_core.core.template_factory.core import TemplateFactory, ReviewContext
 
+# Same file TemplateFactory() loads when no config_root is given
+_MODULES_JSON = Path(__file__).parent.parent.parent / "config" / "modules.json"
+
+# Shared by the render atoms; rebuilt only when modules.json changes on disk
+_FACTORY: Optional[TemplateFactory] = None
+_FACTORY_MTIME: Optional[int] = None
+
+def get_factory() -> TemplateFactory:
+    """The shared TemplateFactory, rebuilt when modules.json changes."""
+    global _FACTORY, _FACTORY_MTIME
+    try:
+        mtime = os.stat(_MODULES_JSON).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _FACTORY is None or mtime != _FACTORY_MTIME:
+        _FACTORY = TemplateFactory()
+        _FACTORY_MTIME = mtime
+    return _FACTORY
+
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
     Renders a template using the TemplateFactory.
@@ -31,10 +51,9 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
 
     # Initialize Factory
     # TODO: Config Path should be injected or standard
-    project_root = Path.cwd()
     # config_path = project_root / "workflow_core" / "config" / "modules.json"
     
-    factory = TemplateFactory()
+    factory = get_factory()
     
     # Render
     # We might need to map "Template Name" to "Module Name" or support raw prompts
@@ -92,7 +111,7 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         # Write to file
         target = Path(target_file)
         if not target.is_absolute():
-            target = project_root / target
+            target = Path.cwd() / target
             
         target.parent.mkdir(parents=True, exist_ok=True)
         
@@ -102,11 +121,14 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         
         if target.exists():
              if mode == "append":
-                 # Check if content already exists to avoid duplication?
-                 # For now, simple append with newline
-                 current = target.read_text(encoding="utf-8")
-                 if rendered_content.strip() not in current:
-                     target.write_text(current + "\n\n" + rendered_content, encoding="utf-8")
+                 # Skip if the content is already there (searched in the decoded
+                 # text, so CRLF files match) and append in place instead of
+                 # rewriting the whole file; text mode translates newlines both ways
+                 with target.open("r+", encoding="utf-8") as f:
+                     present = rendered_content.strip() in f.read()
+                     if not present:
+                         f.write("\n\n" + rendered_content)
+                 if not present:
                      msg = f"Appended to {target}"
                  else:
                      msg = f"Content already in {target} (Skipped Append)"
@@ -12,28 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from pathlib import Path
-import json
+import functools
+import os
 import re
 
+from workflow_core.engine.core.executor import current_cwd
+from workflow_core.infrastructure.config.json_cache import load_json_cached
+
+# Relative to this file: .../engine/atoms/research_sequencer.py -> .../config/
+_CONFIG_ROOT = Path(__file__).parent.parent.parent / "config"
+
 def _load_teams_config(config_root: Path) -> Dict[str, Any]:
     """Loads the core_teams.json configuration."""
-    teams_file = config_root / "core_teams.json"
-    if not teams_file.exists():
-        return {}
-    return json.loads(teams_file.read_text(encoding="utf-8"))
+    return load_json_cached(config_root / "core_teams.json", {})
 
 def _load_personas(config_root: Path) -> Dict[str, Any]:
     """Loads the expert_personas.json configuration."""
-    p_file = config_root / "expert_personas.json"
-    if not p_file.exists():
-        return {}
-    return json.loads(p_file.read_text(encoding="utf-8"))
+    return load_json_cached(config_root / "expert_personas.json", {})
 
+# CamelCase word boundaries for _to_snake_case
+_UPPER1_RE = re.compile('(.)([A-Z][a-z]+)')
+_UPPER2_RE = re.compile('([a-z0-9])([A-Z])')
+
+@functools.lru_cache(maxsize=512)
 def _to_snake_case(name: str) -> str:
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower().replace(" ", "_")
+    s1 = _UPPER1_RE.sub(r'\1_\2', name)
+    return _UPPER2_RE.sub(r'\1_\2', s1).lower().replace(" ", "_")
+
+@functools.lru_cache(maxsize=32)
+def _read_focus_names(config_root: Path, expert_set_name: str, teams_mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """(role, focus file name) per expert in the set, derived once per core_teams.json version."""
+    roles = _load_teams_config(config_root).get("ExpertSets", {}).get(expert_set_name, [])
+    return tuple((role, f"focus_{_to_snake_case(role)}.md") for role in roles)
+
+def _focus_names(config_root: Path, expert_set_name: str) -> Tuple[Tuple[str, str], ...]:
+    try:
+        mtime_ns = (config_root / "core_teams.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _read_focus_names(config_root, expert_set_name, mtime_ns)
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -43,34 +62,30 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     expert_set_name = args.get("expert_set")
     target_dir_name = args.get("target_dir", "audit")
     
-    # 1. Resolve Config
-    # Assume relative to this file: .../engine/atoms/research_sequencer.py -> .../config/
-    config_root = Path(__file__).parent.parent.parent / "config"
-    teams_config = _load_teams_config(config_root)
-    personas_config = _load_personas(config_root)
-    
-    # 2. Resolve Expert List
+    # 1. Resolve Expert List
     if not expert_set_name:
         return {"status": "FAILED", "message": "Research_Sequencer requires 'expert_set' argument."}
         
-    expert_roles = teams_config.get("ExpertSets", {}).get(expert_set_name, [])
-    if not expert_roles:
+    focus_names = _focus_names(_CONFIG_ROOT, expert_set_name)
+    if not focus_names:
          return {"status": "FAILED", "message": f"Expert Set '{expert_set_name}' not found or empty."}
 
-    # 3. Check Artifacts
-    cwd = Path.cwd()
+    # 2. Check Artifacts
+    cwd = current_cwd()
     target_dir = cwd / target_dir_name
-    if not target_dir.exists():
-        target_dir.mkdir(parents=True, exist_ok=True)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    
+    # One directory read instead of a stat per expert
+    with os.scandir(target_dir) as entries:
+        present = {e.name for e in entries}
         
     # Iterate ALL experts (No filtering)
-    for role in expert_roles:
-        safe_role = _to_snake_case(role)
-        focus_file = target_dir / f"focus_{safe_role}.md"
-        
-        if not focus_file.exists():
+    for role, focus_name in focus_names:
+        if focus_name not in present:
+            focus_file = target_dir / focus_name
             # Found a missing artifact -> BLOCK and Request Action
-            persona = personas_config.get(role, {})
+            # (personas are only needed for this message, so load them here)
+            persona = _load_personas(_CONFIG_ROOT).get(role, {})
             checklist = "\n".join([f"   - {item}" for item in persona.get("Checklist", [])])
             
             msg = (
@@ -82,5 +97,5 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
             )
             return {"status": "WAITING", "message": msg}
             
-    # 4. Success
+    # 3. Success
     return {"status": "DONE", "message": f"All Focus Documents for {expert_set_name} are present."}
@@ -12,10 +12,146 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import functools
+import os
+import shutil
 import subprocess
 import shlex
-from typing import Dict, Any
+import tempfile
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, BinaryIO, Iterator, List, Tuple
 from pathlib import Path
+from workflow_core.engine.core.executor import current_cwd
+
+# Output returned to the engine when it was spooled to a report file (the
+# file keeps everything; the step result only carries the tail and its path)
+MAX_RETURNED_OUTPUT = 8 * 1024
+
+# Report files written by several commands keep their descriptor open.
+# Idle descriptors only: one in use is checked out of the cache (see _report_fd),
+# so parallel steps never close a descriptor another thread is writing to.
+MAX_OPEN_REPORTS = 8
+COPY_CHUNK_SIZE = 1024 * 1024
+_OUT_FILES: "OrderedDict[str, int]" = OrderedDict()
+_OUT_LOCK = threading.Lock()
+
+_now = datetime.now
+
+@functools.lru_cache(maxsize=256)
+def _split(command_str: str) -> Tuple[str, ...]:
+    """shlex.split, tokenized once per distinct command string."""
+    return tuple(shlex.split(command_str))
+
+def _status(returncode: int) -> Tuple[str, str]:
+    if returncode == 0:
+        return "DONE", "Command Succeeded"
+    return "FAILED", f"Command Failed (Exit Code {returncode})"
+
+def _tail(spool: BinaryIO) -> str:
+    size = spool.seek(0, os.SEEK_END)
+    spool.seek(max(0, size - MAX_RETURNED_OUTPUT))
+    return spool.read().decode("utf-8", "replace")
+
+@contextlib.contextmanager
+def _report_fd(path: Path) -> Iterator[int]:
+    """
+    Yields an O_APPEND descriptor for a report file, reusing one kept open by an
+    earlier command unless the file was removed or replaced since.
+    """
+    key = str(path)
+    with _OUT_LOCK:
+        fd = _OUT_FILES.pop(key, None)
+    if fd is not None:
+        try:
+            same_file = os.path.samestat(os.fstat(fd), os.stat(key))
+        except FileNotFoundError:
+            same_file = False
+        if not same_file:
+            os.close(fd)
+            fd = None
+    if fd is None:
+        fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        yield fd
+    finally:
+        # Check back in, most recently used last; evict from the front
+        with _OUT_LOCK:
+            # Another writer of the same file may have checked one in meanwhile
+            surplus = [fd] if key in _OUT_FILES else []
+            if not surplus:
+                _OUT_FILES[key] = fd
+                if len(_OUT_FILES) > MAX_OPEN_REPORTS:
+                    surplus.append(_OUT_FILES.popitem(last=False)[1])
+        for stale in surplus:
+            os.close(stale)
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+def _copy_spool(fd: int, spool: BinaryIO):
+    spool.seek(0)
+    for chunk in iter(lambda: spool.read(COPY_CHUNK_SIZE), b""):
+        _write_all(fd, chunk)
+
+def finalize() -> List[str]:
+    """Closes the report descriptors kept open across commands."""
+    with _OUT_LOCK:
+        fds = list(_OUT_FILES.values())
+        _OUT_FILES.clear()
+    for fd in fds:
+        os.close(fd)
+    return []
+
+def _write_report(args: Dict[str, Any], root: Path, command_str: str, status: str, out_spool: BinaryIO, err_spool: BinaryIO) -> Path:
+    """
+    Appends (or writes) the Markdown section for a command, copying its output from the spools.
+    Returns the resolved report path.
+    """
+    o_path = Path(args["output_file"])
+    if not o_path.is_absolute():
+        o_path = root / o_path
+    
+    o_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Format Output for Markdown Report
+    desc = args.get("description", "Command Output")
+    timestamp = _now().isoformat(timespec="seconds")
+    
+    has_out = out_spool.seek(0, os.SEEK_END) > 0
+    has_err = err_spool.seek(0, os.SEEK_END) > 0
+    
+    # Framing around each output is joined into one write
+    head = [
+        f"\n\n## {desc}\n",
+        f"> Executed: `{command_str}` at {timestamp}\n",
+        f"> Status: {status}\n\n",
+    ]
+    if has_out:
+        head.append("```\n")
+    middle = []
+    if has_out:
+        middle.append("\n```\n")
+    if has_err:
+        middle.append("**Standard Error**:\n```\n")
+    
+    with _report_fd(o_path) as fd:
+        if args.get("output_mode", "append") != "append":
+            os.ftruncate(fd, 0)
+        
+        _write_all(fd, "".join(head).encode("utf-8"))
+        if has_out:
+            _copy_spool(fd, out_spool)
+        if middle:
+            _write_all(fd, "".join(middle).encode("utf-8"))
+        if has_err:
+            _copy_spool(fd, err_spool)
+            _write_all(fd, b"\n```\n")
+    return o_path
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -28,7 +164,8 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
          return {"status": "FAILED", "message": "No command specified"}
 
     # Resolve CWD
-    root = Path.cwd()
+    # Engine-provided working directory (saves a getcwd per call)
+    root = current_cwd()
     work_dir = root / cwd
     
     try:
@@ -37,62 +174,45 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         # User requirement implies specific commands like "poetry run pytest ..."
         
         # Split command
-        args_list = shlex.split(command_str)
-        
-        result = subprocess.run(
-            args_list,
-            cwd=str(work_dir),
-            capture_output=True,
-            text=True,
-            check=False # We handle return code manually
-        )
+        args_list = list(_split(command_str))
         
-        if result.returncode == 0:
-            status = "DONE"
-            msg = "Command Succeeded"
-        else:
-            status = "FAILED"
-            msg = f"Command Failed (Exit Code {result.returncode})"
-
-        # Output Capture
         output_file = args.get("output_file")
         if output_file:
-            o_path = Path(output_file)
-            if not o_path.is_absolute():
-                o_path = Path.cwd() / o_path
-            
-            o_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Format Output for Markdown Report
-            desc = args.get("description", "Command Output")
-            import datetime
-            timestamp = datetime.datetime.now().isoformat()
-            
-            # Read existing to append safely?
-            mode = args.get("output_mode", "append")
-            write_mode = "a" if mode == "append" else "w"
-            
-            with open(o_path, write_mode, encoding="utf-8") as f:
-                f.write(f"\n\n## {desc}\n")
-                f.write(f"> Executed: `{command_str}` at {timestamp}\n")
-                f.write(f"> Status: {status}\n\n")
-                
-                if result.stdout:
-                    f.write("```\n")
-                    f.write(result.stdout)
-                    f.write("\n```\n")
-                
-                if result.stderr:
-                    f.write("**Standard Error**:\n```\n")
-                    f.write(result.stderr)
-                    f.write("\n```\n")
+            # The child writes straight into unnamed temp files, so long outputs
+            # are copied to the report in chunks instead of being held in memory
+            with tempfile.TemporaryFile() as out_spool, tempfile.TemporaryFile() as err_spool:
+                result = subprocess.run(
+                    args_list,
+                    cwd=str(work_dir),
+                    stdout=out_spool,
+                    stderr=err_spool,
+                    check=False # We handle return code manually
+                )
+                status, msg = _status(result.returncode)
+                report = _write_report(args, root, command_str, status, out_spool, err_spool)
+                stdout, stderr = _tail(out_spool), _tail(err_spool)
+        else:
+            result = subprocess.run(
+                args_list,
+                cwd=str(work_dir),
+                capture_output=True,
+                text=True,
+                check=False # We handle return code manually
+            )
+            status, msg = _status(result.returncode)
+            stdout, stderr = result.stdout, result.stderr
+            report = None
                     
-        return {
+        res = {
             "status": status, 
             "message": msg,
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "stdout": stdout,
+            "stderr": stderr
         }
+        if report:
+            # Full output lives in the report; stdout/stderr above are tails
+            res["output_file"] = str(report)
+        return res
             
     except Exception as e:
         return {"status": "FAILED", "message": str(e)}
@@ -16,15 +16,18 @@ from typing import Dict, Any
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Updates the context/state with a key-value pair.
+    Updates the context/state with a key-value pair, or several at once.
     Args:
-        args: {"key": "...", "value": "..."}
+        args: {"key": "...", "value": "..."} and/or {"values": {"k1": ..., "k2": ...}}
         context: The workflow context
     """
     key = args.get("key")
     value = args.get("value")
+    values = args.get("values")
     
-    if not key:
+    if values is not None and not isinstance(values, dict):
+        return {"status": "FAILED", "error": "'values' must be a mapping"}
+    if not key and not values:
         return {"status": "FAILED", "error": "Missing 'key' argument"}
         
     # Is this 'Update State' meant to update the *context* passed to future steps?
@@ -42,6 +45,12 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     # If this Atom is purely side-effect based, it might directly modify context?
     # "Update_State" implies direct modification.
     
+    if values:
+        # One step for N keys instead of N Update_State dispatches
+        context.update(values)
+    if not key:
+        return {"status": "COMPLETED", "updated_keys": list(values)}
+    
     context[key] = value
     
     return {
@@ -12,8 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Any
+import mmap
+from typing import Dict, Any, Tuple
 from pathlib import Path
+from workflow_core.engine.core.executor import current_cwd
+
+# (path, marker) -> (mtime_ns, size) of the file version the marker was found in.
+# Polling an unchanged, already-approved file then costs a single stat().
+_MARK_CACHE: Dict[Tuple[str, str], Tuple[int, int]] = {}
+
+def _contains(path: Path, size: int, needle: bytes) -> bool:
+    """Searches the raw file bytes for the UTF-8 encoded marker, without decoding the file."""
+    if size == 0:
+        return False
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        # Removed since the stat()
+        return False
+    with f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Truncated to empty since the stat()
+            return False
+        with mm:
+            return mm.find(needle) != -1
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -30,14 +54,25 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
 
     path = Path(target_file)
     if not path.is_absolute():
-        path = Path.cwd() / path
+        path = current_cwd() / path
         
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return {"status": "WAITING", "message": f"File {target_file} does not exist yet."}
-        
-    content = path.read_text(encoding="utf-8")
     
-    if marker == "*" or marker in content:
+    # Wildcard only asks for the file to exist
+    if marker == "*":
+        return {"status": "DONE", "message": f"Found marker '{marker}'"}
+    
+    key = (str(path), marker)
+    version = (st.st_mtime_ns, st.st_size)
+    if _MARK_CACHE.get(key) == version:
+        return {"status": "DONE", "message": f"Found marker '{marker}'"}
+    
+    if _contains(path, st.st_size, marker.encode("utf-8")):
+        _MARK_CACHE[key] = version
         return {"status": "DONE", "message": f"Found marker '{marker}'"}
     else:
+        _MARK_CACHE.pop(key, None)
         return {"status": "WAITING", "message": f"Waiting for '{marker}' in {target_file}"}
@@ -12,8 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TextIO
+import math
+import queue
+import select
 import sys
+import threading
+
+# Reader for streams select() cannot poll (e.g. Windows console, replaced stream).
+# A read that outlives its timeout stays pending and answers the next call.
+_LINES: "queue.Queue[str]" = queue.Queue()
+_READER: Optional[threading.Thread] = None
+_READER_LOCK = threading.Lock()
+
+def _read_line_threaded(stream: TextIO, timeout: float) -> Optional[str]:
+    global _READER
+    with _READER_LOCK:
+        if (_READER is None or not _READER.is_alive()) and _LINES.empty():
+            _READER = threading.Thread(target=lambda: _LINES.put(stream.readline()), daemon=True)
+            _READER.start()
+    try:
+        return _LINES.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+def _read_line(stream: TextIO, timeout: Optional[float]) -> Optional[str]:
+    """
+    Reads one line from `stream`. With a timeout, waits for readiness via select()
+    and returns None if nothing arrived; raises EOFError when the stream is closed.
+    """
+    if timeout is None:
+        return input(">> ")
+    try:
+        ready, _, _ = select.select([stream], [], [], timeout)
+    except (OSError, ValueError):
+        line = _read_line_threaded(stream, timeout)
+    else:
+        line = stream.readline() if ready else None
+    if line == "":
+        raise EOFError
+    return line
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -21,15 +59,42 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
     Useful for transitions like Draft -> Review where no file artifact is desired.
     """
     message = args.get("message", "Continue?")
+    # Seconds to wait for an answer; 0 polls without blocking, None blocks (default)
+    timeout = args.get("timeout")
+    if timeout is not None:
+        try:
+            timeout = float(timeout)
+        except (TypeError, ValueError):
+            timeout = -1.0
+        if not math.isfinite(timeout) or timeout < 0:
+            return {"status": "FAILED", "message": f"Invalid timeout: {args.get('timeout')!r}"}
+    
+    stream = sys.stdin
+    try:
+        interactive = stream.isatty()
+    except (AttributeError, ValueError):
+        # No stdin, or it was closed
+        return {"status": "WAITING", "message": "Input stream closed."}
     
-    # Check if running in non-interactive mode (e.g. CI)
-    # For now, we assume interactive if this atom is used.
+    if interactive:
+        print(f"\n>> INTERACTION REQUIRED: {message} [y/N]")
+        if timeout is not None:
+            sys.stdout.write(">> ")
+            sys.stdout.flush()
+    elif timeout is None:
+        # Non-interactive (e.g. CI, piped stdin): take an answer only if one is
+        # already there instead of blocking on a stream nobody may write to
+        timeout = 0.0
     
-    print(f"\n>> INTERACTION REQUIRED: {message} [y/N]")
     try:
-        response = input(">> ").strip().lower()
+        line = _read_line(stream, timeout)
     except EOFError:
         return {"status": "WAITING", "message": "Input stream closed."}
+    if line is None:
+        if not interactive:
+            return {"status": "WAITING", "message": "Non-interactive session; awaiting external confirmation."}
+        return {"status": "WAITING", "message": "No answer yet."}
+    response = line.strip().lower()
         
     if response == 'y':
         return {"status": "DONE", "message": "User confirmed."}
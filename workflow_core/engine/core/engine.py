@@ -12,11 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import functools
+import json
 import logging
+import os
+import re
+import threading
+import time
 import traceback
-from typing import Optional, Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Tuple
 from pathlib import Path
-from datetime import datetime, timezone
 
 from workflow_core.engine.schemas.models import (
     WorkflowState, WorkflowDefinition, WorkflowStep, StepState, StateStatus, StepType
@@ -29,6 +36,36 @@ from workflow_core.engine.core.executor import AtomExecutor
 # logging.basicConfig(level=logging.INFO) <--- REMOVED SIDE EFFECT
 logger = logging.getLogger("WorkflowEngine")
 
+# Upper bound on concurrently running steps of one parallel group
+MAX_PARALLEL_STEPS = 8
+
+# `${var}` placeholders: args allow dotted paths (config.root), instructions flat keys
+_VAR_RE_DOTTED = re.compile(r'\$\{([a-zA-Z0-9_.]+)\}')
+_VAR_RE_SIMPLE = re.compile(r'\$\{([a-zA-Z0-9_]+)\}')
+
+# Step args and instructions are fixed per workflow definition while the context
+# changes between runs, so only the context-independent half is memoized: the
+# template split into [literal, key, literal, key, ..., literal].
+@functools.lru_cache(maxsize=1024)
+def _split_dotted(template: str) -> Tuple[Any, ...]:
+    """Key slots hold (key, key path) so nested lookups need no split per call."""
+    parts: List[Any] = _VAR_RE_DOTTED.split(template)
+    parts[1::2] = [(key, tuple(key.split("."))) for key in parts[1::2]]
+    return tuple(parts)
+
+@functools.lru_cache(maxsize=256)
+def _split_simple(template: str) -> Tuple[str, ...]:
+    return tuple(_VAR_RE_SIMPLE.split(template))
+
+def _substitute(parts: Tuple[Any, ...], lookup: Callable[[Any], str]) -> str:
+    """Joins a split template, replacing every key (odd positions) with lookup(key)."""
+    if len(parts) == 3:
+        # Single placeholder, the common case for prompts
+        return parts[0] + lookup(parts[1]) + parts[2]
+    out = list(parts)
+    out[1::2] = map(lookup, parts[1::2])
+    return "".join(out)
+
 class WorkflowEngine:
     """
     The Core Workflow Engine V2.
@@ -48,32 +85,32 @@ class WorkflowEngine:
         if not atoms_file.exists():
             raise FileNotFoundError(f"Atoms registry missing at {atoms_file}")
             
-        import json
         self.atoms_registry = json.loads(atoms_file.read_text(encoding="utf-8"))
         self.executor = AtomExecutor(self.atoms_registry)
+        # Nesting level of run_workflow (sub-workflows recurse, possibly from
+        # parallel group threads)
+        self._run_depth = 0
+        self._depth_lock = threading.Lock()
 
     def _resolve_args(self, args: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Resolves `${var}` placeholders in arguments from context using Regex.
         Supports complex strings like "${dir}/${file}.txt".
+        Returns `args` itself (not a copy) when nothing needs resolving.
         """
-        import re
-        
-        def replace_match(match):
-            key = match.group(1)
+        if not any(isinstance(v, str) and "${" in v for v in args.values()):
+            return args
             
-            # Support nested keys (e.g. config.root)
-            parts = key.split('.')
+        def lookup(slot):
+            # Support nested keys (e.g. config.root); the path is pre-split
+            key, path = slot
             val = context
-            try:
-                for p in parts:
-                    if isinstance(val, dict):
-                        val = val.get(p)
-                    else:
-                        val = None
-                        break
-            except (AttributeError, TypeError):
-                val = None
+            for p in path:
+                if isinstance(val, dict):
+                    val = val.get(p)
+                else:
+                    val = None
+                    break
 
             # Fallback to direct key lookup (if key has dots but is stored flat)
             if val is None:
@@ -81,13 +118,10 @@ class WorkflowEngine:
                 
             return str(val) if val is not None else f"${{{key}}}"
 
-        resolved = {}
-        for k, v in args.items():
-            if isinstance(v, str) and "${" in v:
-                resolved[k] = re.sub(r'\$\{([a-zA-Z0-9_.]+)\}', replace_match, v)
-            else:
-                resolved[k] = v
-        return resolved
+        return {
+            k: _substitute(_split_dotted(v), lookup) if isinstance(v, str) and "${" in v else v
+            for k, v in args.items()
+        }
 
     def _export_context(self, output: Dict[str, Any], export_map: Dict[str, str], context: Dict[str, Any]):
         """
@@ -108,19 +142,20 @@ class WorkflowEngine:
         """
         if not instructions:
             return None
+        if "${" not in instructions:
+            # Nothing to substitute; skip the regex pass
+            return instructions
             
         resolved = instructions
         # Simple string replacement for now. 
         # For more robust parsing we could use string.Template or regex.
         # But we need to handle "missing" keys gracefully (keep placeholder).
-        import re
         
-        def replace_match(match):
-            key = match.group(1)
+        def lookup(key):
             return str(context.get(key, f"${{{key}}}"))
             
-        # Regex to find ${key}
-        resolved = re.sub(r'\$\{([a-zA-Z0-9_]+)\}', replace_match, instructions)
+        # Regex to find ${key} (split once per distinct instructions string)
+        resolved = _substitute(_split_simple(instructions), lookup)
         return resolved
 
     def run_workflow(self, task_id: str, workflow_name: str, context: Dict[str, Any] = None) -> WorkflowState:
@@ -152,6 +187,8 @@ class WorkflowEngine:
         # Ensure Critical Task Variables are in Context
         state.context_cache["task_id"] = task_id
         state.context_cache["task_id_snake"] = task_id.replace('.', '_')
+        # Dropped from states saved when the working directory lived in the context
+        state.context_cache.pop("_cwd", None)
 
         # 2. Load Definition
         try:
@@ -161,6 +198,11 @@ class WorkflowEngine:
             raise
 
         # 3. Execution Loop
+        with self._depth_lock:
+            if self._run_depth == 0:
+                # Working directory for atoms, resolved once per top-level run
+                self.executor.cwd = os.getcwd()
+            self._run_depth += 1
         try:
             self._execute_steps(state, workflow_def)
         except Exception as e:
@@ -171,7 +213,19 @@ class WorkflowEngine:
             # Here we just re-raise.
             raise
         finally:
-            # 4. Persistence
+            with self._depth_lock:
+                self._run_depth -= 1
+                top_level = self._run_depth == 0
+            # 4. Teardown: wait for atoms' background work once the top-level run ends;
+            # a failure there (e.g. a background git push) fails the workflow
+            if top_level:
+                errors = self.executor.finalize()
+                for error in errors:
+                    logger.error(error)
+                state.error = "\n".join(errors) or None
+                if errors:
+                    state.status = StateStatus.FAILED
+            # 5. Persistence
             self.persistence.save_state(state)
             
         return state
@@ -179,114 +233,182 @@ class WorkflowEngine:
     def _execute_steps(self, state: WorkflowState, workflow_def: WorkflowDefinition):
         """
         Internal loop to execute steps sequentially.
+        Adjacent steps marked `parallel` run concurrently as one group.
         """
         state.status = StateStatus.IN_PROGRESS
-        total_steps = len(workflow_def.steps)
+        steps = workflow_def.steps
+        total_steps = len(steps)
         
         while state.current_step_index < total_steps:
-            step_def = workflow_def.steps[state.current_step_index]
-            step_id = step_def.id
-            
-            # Check Step State
-            step_state = state.steps_history.get(step_id)
-            if not step_state:
-                step_state = StepState(step_id=step_id, status=StateStatus.PENDING)
-                state.steps_history[step_id] = step_state
+            step_def = steps[state.current_step_index]
+            step_state = self._get_step_state(state, step_def.id)
 
             if step_state.status == StateStatus.COMPLETED:
                 # Already done, move next
                 state.current_step_index += 1
                 continue
-                
-            # Execute
-            logger.info(f"Executing Step: {step_id} ({step_def.type.value}: {step_def.ref})")
-            step_state.status = StateStatus.IN_PROGRESS
-            step_state.started_at = datetime.now(timezone.utc).isoformat()
-            
-            # DEBUG INJECTION
-            ad = state.context_cache.get('artifact_dir')
-            print(f">> [DEBUG] Step {step_id} Context artifact_dir: {ad}")
             
-            try:
-                # Resolve Args from Context
-                resolved_args = self._resolve_args(step_def.args, state.context_cache)
-                
-                # Resolve Instructions (Prompt)
-                resolved_instructions = self._resolve_instructions(step_def.instructions, state.context_cache)
-                if resolved_instructions:
-                    logger.info(f"Step Instructions: {resolved_instructions}")
-                    # TODO: In a real interactive mode, this would be printed to the user/HUD.
-
-                if step_def.type == StepType.ATOM:
-                    # Pass RESOLVED args, not raw def args. 
-                    # Note: AtomExecutor currently expects step_def. 
-                    # We might need to construct a temporary step_def or pass args separately.
-                    # Looking at executor.py (assumed), it likely reads step_def.args.
-                    # Let's verify executor signatue. 
-                    # self.executor.execute_step(step_def, state.context_cache)
-                    # We should probably modify step_def.args in memory for this execution.
-                    
-                    # Create a standard copy with resolved args for execution
-                    # Pydantic models are immutable-ish by default but we can use model_copy
-                    # Also inject resolved instructions if the atom uses them (e.g. Wait_Approval)
-                    update_dict = {"args": resolved_args}
-                    if resolved_instructions:
-                        update_dict["instructions"] = resolved_instructions
-                        
-                    step_def_runtime = step_def.model_copy(update=update_dict)
-                    
-                    output = self.executor.execute_step(step_def_runtime, state.context_cache)
-                
-                    # Check for Blocking Condition (e.g. Wait_Approval returns "WAITING")
-                    if output.get("status") == "WAITING":
-                        # Stop Execution, Persist State
-                        logger.info(f"Workflow Blocked at {step_id}: {output.get('message')}")
-                        step_state.output = output
-                        return 
-                        
-                    step_state.output = output
-                    step_state.status = StateStatus.COMPLETED
-                    step_state.completed_at = datetime.now(timezone.utc).isoformat()
-                    
-                    # Export Outputs to Context
-                    if step_def.export:
-                        self._export_context(output, step_def.export, state.context_cache)
-
-                    # Auto-Advance
-                    state.current_step_index += 1
+            if step_def.parallel:
+                # Independent branches: the whole run of parallel steps at once
+                group_end = state.current_step_index
+                while group_end < total_steps and steps[group_end].parallel:
+                    group_end += 1
+                if not self._execute_group(state, steps[state.current_step_index:group_end]):
+                    return
+                state.current_step_index = group_end
+                continue
                 
-                elif step_def.type == StepType.WORKFLOW:
-                    # Recursive Call
-                    # Sub-Context: specific overrides from args + global context
-                    # If args has {"foo": "bar"}, it overrides context["foo"]?
-                    # Or is it strictly for the sub-workflow's 'external' interface?
-                    # For now: Merge Global Context + Resolved Args
-                    sub_context = {**state.context_cache, **resolved_args}
-                    
-                    sub_task_id = f"{state.task_id}#{step_id}"
-                    sub_state = self.run_workflow(sub_task_id, step_def.ref, sub_context)
-                    
-                    if sub_state.current_step_index >= len(self.loader.load_workflow(step_def.ref).steps):
-                            # Sub-workflow complete
-                            # Logic: How do we get OUTPUT from a sub-workflow? 
-                            # Maybe the sub-workflow state has an 'output' field? 
-                            # Or we just assume side-effects? 
-                            # For strict V2, we might want to export from sub-workflow context?
-                            # TODO: Implement Sub-Workflow Output Mapping
-                            
-                            step_state.status = StateStatus.COMPLETED
-                            state.current_step_index += 1
-                    else:
-                        # Sub-workflow blocked
-                        logger.info(f"Sub-Workflow {step_def.ref} Blocked.")
-                        return
-
+            try:
+                resolved_args = self._start_step(state, step_def, step_state)
+                advanced = self._finish_step(state, step_def, step_state, self._invoke_step(state, step_def, resolved_args))
             except Exception as e:
-                state.status = StateStatus.FAILED
-                step_state.status = StateStatus.FAILED
-                step_state.error = str(e)
-                logger.error(f"Step {step_id} Failed: {e}")
+                self._fail_step(state, step_def, step_state, e)
                 raise e
+            if not advanced:
+                return
+            
+            # Auto-Advance
+            state.current_step_index += 1
 
         # If loop finishes, workflow is complete
         state.status = StateStatus.COMPLETED
+
+    def _execute_group(self, state: WorkflowState, group: List[WorkflowStep]) -> bool:
+        """
+        Runs a group of parallel steps concurrently.
+        All members resolve their args against the context as it was before the
+        group and run on their own copy of it; context changes, results and
+        exports are applied in declaration order once the group has finished.
+        Returns False if any member is blocked (it is retried on the next run).
+        """
+        pending = []
+        for step_def in group:
+            step_state = self._get_step_state(state, step_def.id)
+            if step_state.status != StateStatus.COMPLETED:
+                pending.append((step_def, step_state))
+        
+        prepared = []
+        for step_def, step_state in pending:
+            try:
+                if step_def.type == StepType.WORKFLOW:
+                    # Resolve sub-workflow definitions up front, not from the workers
+                    self.loader.load_workflow(step_def.ref)
+                prepared.append(self._start_step(state, step_def, step_state))
+            except Exception as e:
+                self._fail_step(state, step_def, step_state, e)
+                raise e
+        
+        contexts = [copy.deepcopy(state.context_cache) for _ in pending]
+        with ThreadPoolExecutor(max_workers=min(len(pending), MAX_PARALLEL_STEPS) or 1) as pool:
+            futures = [
+                pool.submit(self._invoke_step, state, step_def, args, context=context)
+                for (step_def, _), args, context in zip(pending, prepared, contexts)
+            ]
+        
+        # Changes each member made to its copy, all taken against the pre-group context
+        base = state.context_cache
+        deltas = [
+            ({k: v for k, v in context.items() if k not in base or base[k] != v},
+             [k for k in base if k not in context])
+            for context in contexts
+        ]
+        
+        # Record every finished member before surfacing the first failure
+        all_done = True
+        first_error = None
+        for (step_def, step_state), future, (changed, removed) in zip(pending, futures, deltas):
+            base.update(changed)
+            for key in removed:
+                base.pop(key, None)
+            try:
+                if not self._finish_step(state, step_def, step_state, future.result()):
+                    all_done = False
+            except Exception as e:
+                self._fail_step(state, step_def, step_state, e)
+                first_error = first_error or e
+        if first_error:
+            raise first_error
+        return all_done
+
+    def _get_step_state(self, state: WorkflowState, step_id: str) -> StepState:
+        step_state = state.steps_history.get(step_id)
+        if not step_state:
+            step_state = StepState(step_id=step_id, status=StateStatus.PENDING)
+            state.steps_history[step_id] = step_state
+        return step_state
+
+    def _start_step(self, state: WorkflowState, step_def: WorkflowStep, step_state: StepState) -> Dict[str, Any]:
+        """Marks the step as started, resolves its args and logs its instructions."""
+        logger.info("Executing Step: %s (%s: %s)", step_def.id, step_def.type.value, step_def.ref)
+        step_state.status = StateStatus.IN_PROGRESS
+        step_state.started_at = time.time_ns()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Step %s Context artifact_dir: %s", step_def.id, state.context_cache.get('artifact_dir'))
+        
+        # Resolve Args from Context
+        resolved_args = self._resolve_args(step_def.args, state.context_cache)
+        
+        # Resolve Instructions (Prompt)
+        resolved_instructions = self._resolve_instructions(step_def.instructions, state.context_cache)
+        if resolved_instructions:
+            logger.info("Step Instructions: %s", resolved_instructions)
+            # TODO: In a real interactive mode, this would be printed to the user/HUD.
+        return resolved_args
+
+    def _invoke_step(self, state: WorkflowState, step_def: WorkflowStep, resolved_args: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Runs the atom (returns its output) or the sub-workflow (returns its state).
+        Does not touch the step's bookkeeping, so it may run on a worker thread
+        (pass `context`, a private copy of the context, when it does).
+        """
+        if context is None:
+            context = state.context_cache
+        if step_def.type == StepType.ATOM:
+            # Pass RESOLVED args, not raw def args, alongside the step
+            # definition instead of copying it.
+            return self.executor.execute_step(step_def, context, resolved_args=resolved_args)
+        
+        # Recursive Call
+        # Sub-Context: Merge Global Context + Resolved Args (args override context)
+        sub_context = {**context, **resolved_args}
+        
+        sub_task_id = f"{state.task_id}#{step_def.id}"
+        return self.run_workflow(sub_task_id, step_def.ref, sub_context)
+
+    def _finish_step(self, state: WorkflowState, step_def: WorkflowStep, step_state: StepState, result: Any) -> bool:
+        """Records the result of `_invoke_step`. Returns False if the step is blocked."""
+        if step_def.type == StepType.ATOM:
+            output = result
+            # Check for Blocking Condition (e.g. Wait_Approval returns "WAITING")
+            if output.get("status") == "WAITING":
+                # Stop Execution, Persist State
+                logger.info(f"Workflow Blocked at {step_def.id}: {output.get('message')}")
+                step_state.output = output
+                return False
+                
+            step_state.output = output
+            step_state.status = StateStatus.COMPLETED
+            step_state.completed_at = time.time_ns()
+            
+            # Export Outputs to Context
+            if step_def.export:
+                self._export_context(output, step_def.export, state.context_cache)
+            return True
+        
+        sub_state = result
+        if sub_state.is_complete:
+            # Sub-workflow complete
+            # TODO: Implement Sub-Workflow Output Mapping (export from sub-workflow context?)
+            step_state.status = StateStatus.COMPLETED
+            return True
+        
+        # Sub-workflow blocked
+        logger.info(f"Sub-Workflow {step_def.ref} Blocked.")
+        return False
+
+    def _fail_step(self, state: WorkflowState, step_def: WorkflowStep, step_state: StepState, e: Exception):
+        state.status = StateStatus.FAILED
+        step_state.status = StateStatus.FAILED
+        step_state.error = str(e)
+        logger.error(f"Step {step_def.id} Failed: {e}")
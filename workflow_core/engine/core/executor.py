@@ -12,19 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import importlib
-from typing import Dict, Any
+import string
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
 from workflow_core.engine.schemas.models import WorkflowStep, StepType
 
+# Legacy `{var}` arg interpolation (`${var}` is resolved by the engine beforehand)
+_FMT = string.Formatter()
+
+# Working directory of the running workflow, visible to atoms while their `run` executes
+_CWD: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("workflow_cwd", default=None)
+
+def current_cwd() -> Path:
+    """Working directory for atoms: the engine's for the current run, else the process's."""
+    cwd = _CWD.get()
+    return Path(cwd) if cwd else Path.cwd()
+
 class AtomExecutor:
     """Executes Atomic Tasks by mapping them to Python functions."""
     
     def __init__(self, atoms_registry: Dict[str, Any]):
         self.registry = atoms_registry
+        # step.ref -> the atom module's `run`, resolved on first use
+        self._run_cache: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Dict[str, Any]]] = {}
+        # Set by the engine once per top-level run; kept out of the (persisted) context
+        self.cwd: Optional[str] = None
 
-    def execute_step(self, step: WorkflowStep, context: Dict[str, Any]) -> Dict[str, Any]:
+    def execute_step(self, step: WorkflowStep, context: Dict[str, Any], *,
+                     resolved_args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Execute a single atomic step.
+        `resolved_args` (placeholders already substituted by the engine) are used
+        instead of `step.args` when given, so the step needs no runtime copy.
         Returns the output dictionarly.
         """
         if step.type != StepType.ATOM:
@@ -40,19 +62,25 @@ class AtomExecutor:
              return {"status": "MOCKED", "message": f"Executed {step.ref}"}
 
         try:
-            # Dynamic Import
-            module = importlib.import_module(module_name)
-            if not hasattr(module, "run"):
-                 raise AttributeError(f"Module {module_name} missing 'run' function")
+            # Dynamic Import (once per atom reference)
+            run_fn = self._run_cache.get(step.ref)
+            if run_fn is None:
+                module = importlib.import_module(module_name)
+                run_fn = getattr(module, "run", None)
+                if run_fn is None:
+                     raise AttributeError(f"Module {module_name} missing 'run' function")
+                self._run_cache[step.ref] = run_fn
             
             # Merit arguments: Step Args override Default Args
             # Interpolation Logic
+            step_args = resolved_args if resolved_args is not None else step.args
             final_args = {}
-            for k, v in step.args.items():
-                if isinstance(v, str):
+            for k, v in step_args.items():
+                if isinstance(v, str) and ("{" in v or "}" in v):
                     try:
-                        # Allow interpolation from context
-                        final_args[k] = v.format(**context)
+                        # Allow interpolation from context (the mapping is read
+                        # in place instead of being unpacked into kwargs)
+                        final_args[k] = _FMT.vformat(v, (), context)
                     except KeyError:
                         # If context key missing, leave as is or fail?
                         # Best effort: leave as is if format fails?
@@ -63,10 +91,28 @@ class AtomExecutor:
                     final_args[k] = v
             
             # Execute
-            result = module.run(final_args, context)
+            token = _CWD.set(self.cwd)
+            try:
+                result = run_fn(final_args, context)
+            finally:
+                _CWD.reset(token)
             return result
             
         except ImportError as e:
             raise ImportError(f"Failed to load atom module {module_name}: {e}")
         except Exception as e:
             raise RuntimeError(f"Atom Execution Failed: {e}")
+
+    def finalize(self) -> List[str]:
+        """
+        Lets loaded atom modules complete background work (module-level `finalize()`).
+        Returns the error messages they report.
+        """
+        errors = []
+        module_names = {a.get("python_module") for a in self.registry.get("Atoms", {}).values()}
+        for module_name in module_names:
+            module = sys.modules.get(module_name) if module_name else None
+            hook = getattr(module, "finalize", None)
+            if hook:
+                errors.extend(hook())
+        return errors
@@ -12,35 +12,40 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict
 from pydantic import ValidationError
 from workflow_core.engine.schemas.models import WorkflowDefinition
+from workflow_core.infrastructure.config.json_cache import json_loads
 
 class WorkflowLoader:
     def __init__(self, config_root: Path):
         self.config_root = config_root
         self.workflows_dir = config_root / "workflows"
         self._cache: Dict[str, WorkflowDefinition] = {}
+        # Built once and only read afterwards, so parallel steps can look up without a lock
         self._index: Dict[str, Path] = {}
         self._build_index()
 
     def _build_index(self):
-        """Scan all JSON files and map internal 'name' to file path."""
+        """
+        Scan all JSON files and map internal 'name' to file path (last file wins),
+        then filename stems as aliases (first file wins, internal names take precedence).
+        """
         if not self.workflows_dir.exists():
              return
 
+        stems: Dict[str, Path] = {}
         for file_path in self.workflows_dir.rglob("*.json"):
             try:
-                data = json.loads(file_path.read_text(encoding="utf-8"))
-                if "name" in data:
-                    self._index[data["name"]] = file_path
-                    # Also map filename stem as alias if unique
-                    if file_path.stem not in self._index:
-                         self._index[file_path.stem] = file_path
-            except (json.JSONDecodeError, OSError):
+                data = json_loads(file_path.read_bytes())
+            except (ValueError, OSError):
                 continue
+            if isinstance(data, dict) and "name" in data:
+                self._index[data["name"]] = file_path
+                stems.setdefault(file_path.stem, file_path)
+        for stem, file_path in stems.items():
+            self._index.setdefault(stem, file_path)
 
     def load_workflow(self, name: str) -> WorkflowDefinition:
         """
@@ -50,19 +55,18 @@ class WorkflowLoader:
             return self._cache[name]
 
         # Check Index
-        if name not in self._index:
+        file_path = self._index.get(name)
+        if file_path is None:
              # Try mapping "Impl.Feature" -> "feature_impl" manually if needed, 
              # but prefer the index finding "Impl.Feature" via internal name.
              raise FileNotFoundError(f"Workflow config not found for: {name}")
-
-        file_path = self._index[name]
         
         try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-            workflow = WorkflowDefinition(**data)
+            # Parse and validate the raw bytes in one pass (pydantic-core)
+            workflow = WorkflowDefinition.model_validate_json(file_path.read_bytes())
             self._cache[name] = workflow
             return workflow
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in {file_path}: {e}")
         except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                raise ValueError(f"Invalid JSON in {file_path}: {e}")
             raise ValueError(f"Schema Validation Failed for {file_path}: {e}")
@@ -18,6 +18,31 @@ from typing import List, Dict, Optional, Tuple, Any
 from ...flow_manager.template_factory.core import TemplateFactory, ReviewContext
 from ...flow_manager.templater import detect_language
 
+# Status row of a section still awaiting its reviewer
+_PENDING_TOKEN = "| **Status** | [ ] PENDING |"
+_FINAL_VERDICT = "## Final Verdict"
+
+# One pass over the report for everything determine_next_action needs:
+# "### Reviewer: <Role>" headers (the role is captured by a lookahead, so a
+# token later on the same line is still seen), the pending token and the
+# final verdict heading.
+_REPORT_SCAN_RE = re.compile(
+    r"### Reviewer: (?=(.+))|(" + re.escape(_PENDING_TOKEN) + ")|(" + re.escape(_FINAL_VERDICT) + ")"
+)
+
+def _scan_report(content: str) -> Tuple[List[str], bool, bool]:
+    """Returns (reviewer roles in order, has pending section, has final verdict)."""
+    roles: List[str] = []
+    has_pending = has_final = False
+    for m in _REPORT_SCAN_RE.finditer(content):
+        if m.group(1) is not None:
+            roles.append(m.group(1))
+        elif m.group(2):
+            has_pending = True
+        else:
+            has_final = True
+    return roles, has_pending, has_final
+
 class ReviewOrchestrator:
     """
     Encapsulates the 'Sequential Expert Review' logic (The Gauntlet).
@@ -53,32 +78,30 @@ class ReviewOrchestrator:
         try:
             from ...flow_manager.scripts.validate_review_completeness import check_review_completeness
             # Strict Mode: Check if current sections are filled
-            if not check_review_completeness(str(report_path), ignore_pending=False, check_verdict=False):
+            if not check_review_completeness(str(report_path), ignore_pending=False, check_verdict=False, content=content):
                 return "BLOCKED", f"Review Validation Failed: {report_path.name} is incomplete (Check Evidence/Status)."
         except ImportError:
             # Fallback if pathing is weird
             pass
 
+        found_roles, has_pending, has_final = _scan_report(content)
+
         # 2. Check for PENDING status in existing text
-        if "| **Status** | [ ] PENDING |" in content:
+        if has_pending:
             # parsing who is pending
-            found_roles = re.findall(r"### Reviewer: (.+)", content)
             pending_role = found_roles[-1] if found_roles else "Unknown"
             return "BLOCKED", f"Expert Review Pending: {pending_role}. Please complete the report."
 
         # 3. Determine Next Expert
-        found_roles = re.findall(r"### Reviewer: (.+)", content)
-        next_expert = None
-        for mod in expert_modules:
-            if mod.get("Role") not in found_roles:
-                next_expert = mod
-                break
+        # Set lookup keeps this linear in experts + reviewers
+        found_set = set(found_roles)
+        next_expert = next((mod for mod in expert_modules if mod.get("Role") not in found_set), None)
         
         if next_expert:
-            return self._append_next_expert(report_path, content, next_expert, context)
+            return self._append_next_expert(report_path, content, next_expert, context, has_final)
         
         # 4. Final Verdict
-        if "## Final Verdict" not in content:
+        if not has_final:
             return self._append_footer(report_path, content, base_modules, context)
             
         # 5. Check Final Verdict Sign-off
@@ -125,11 +148,11 @@ class ReviewOrchestrator:
         role = experts[0]['Role'] if experts else "None"
         return "BLOCKED", f"Sequential Review Started. First Expert: {role}."
 
-    def _append_next_expert(self, path, content, expert, ctx) -> Tuple[str, str]:
+    def _append_next_expert(self, path, content, expert, ctx, has_final) -> Tuple[str, str]:
         print(f">> [SEQ] Unlocking Next Expert: {expert['Role']}")
         new_section = self.factory.render_single_module(expert["Name"], ctx)
         
-        if "## Final Verdict" in content:
+        if has_final:
             new_content = content.replace("## Final Verdict", f"\n\n{new_section}\n\n## Final Verdict")
         else:
             new_content = content + "\n\n" + new_section
@@ -14,12 +14,28 @@
 
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Tuple
+
+def _make_resolver(tag_index: Dict[str, Tuple[int, str]], svc_index: Dict[str, str], default: str) -> Callable[[Dict[str, Any]], str]:
+    """Resolver for one rule type, bound to its prebuilt lookup tables."""
+    def resolve(context: Dict[str, Any]) -> str:
+        # 1. Tags (Priority)
+        # If ANY tag matches, the earliest matching rule wins
+        hits = [tag_index[t] for t in context.get("Tags", []) if t in tag_index]
+        if hits:
+            return min(hits)[1]
+
+        # 2. Service Type
+        # Exact match only (configuration uses exact strings)
+        # 3. Default
+        return svc_index.get(context.get("ServiceType", ""), default)
+    return resolve
 
 class RulesEngine:
     def __init__(self, config_root: Path):
         self.config_path = config_root / "rules.json"
         self.rules = self._load_rules()
+        self._index_rules()
 
     def _load_rules(self) -> Dict[str, List[Dict]]:
         if not self.config_path.exists():
@@ -31,43 +47,34 @@ class RulesEngine:
             print(f">> [RULES] Error loading rules.json: {e}")
             return {}
 
+    def _index_rules(self):
+        """
+        Builds one resolver per rule type from lookup tables made once here, so
+        resolve needs no scan of the rules:
+        tag -> (rule position, Result), ServiceType -> Result and the default Result.
+        The first matching rule wins, as in the rules' declaration order.
+        """
+        self._resolvers: Dict[str, Callable[[Dict[str, Any]], str]] = {}
+        for rule_type, candidates in self.rules.items():
+            tag_index: Dict[str, Tuple[int, str]] = {}
+            svc_index: Dict[str, str] = {}
+            default = None
+            for pos, rule in enumerate(candidates):
+                for tag in rule.get("Tags", ()):
+                    tag_index.setdefault(tag, (pos, rule["Result"]))
+                if "ServiceType" in rule:
+                    svc_index.setdefault(rule["ServiceType"], rule["Result"])
+                if default is None and rule.get("Default"):
+                    default = rule["Result"]
+            self._resolvers[rule_type] = _make_resolver(tag_index, svc_index, "Unknown" if default is None else default)
+
     def resolve(self, rule_type: str, context: Dict[str, Any]) -> str:
         """
         Resolves a rule type (AuthorRole, CouncilSet) based on context.
         Context expected keys: 'ServiceType' (str), 'Tags' (list of str)
         """
-        if rule_type not in self.rules:
-            return "Unknown"
-
-        candidates = self.rules[rule_type]
-        service_type = context.get("ServiceType", "")
-        tags = set(context.get("Tags", []))
-
-        # 1. Tags (Priority)
-        # Check rules that have Tags defined
-        for rule in candidates:
-            if "Tags" in rule:
-                rule_tags = set(rule["Tags"])
-                # If ANY tag matches (Intersection)
-                if tags.intersection(rule_tags):
-                    return rule["Result"]
-
-        # 2. Service Type
-        for rule in candidates:
-            if "ServiceType" in rule:
-                # Direct match or partial match?
-                # Configuration assumes exact strings usually, but let's stick to exact for now as per JSON.
-                if rule["ServiceType"] == service_type:
-                    return rule["Result"]
-                # Heuristic: If ServiceType in rules is "Engine" but context is "ExecutionEngine" -> maybe?
-                # For now, strict.
-
-        # 3. Default
-        for rule in candidates:
-            if rule.get("Default"):
-                return rule["Result"]
-
-        return "Unknown"
+        resolver = self._resolvers.get(rule_type)
+        return resolver(context) if resolver else "Unknown"
 
     def resolve_author_role(self, service_type: str, tags: List[str]) -> str:
         return self.resolve("AuthorRole", {"ServiceType": service_type, "Tags": tags})
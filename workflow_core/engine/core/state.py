@@ -12,17 +12,53 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import hashlib
+import os
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 from pydantic import ValidationError
-from workflow_core.engine.schemas.models import WorkflowState
+from workflow_core.engine.schemas.models import StateStatus, StepState, WorkflowState, parse_timestamp
+from workflow_core.infrastructure.config.json_cache import json_loads
+
+# Task ids -> file names ("1.2/3" -> "1_2_3") in one pass
+_SAFE_ID = str.maketrans({".": "_", "/": "_"})
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+def _construct_state(data: Dict[str, Any]) -> WorkflowState:
+    """
+    Builds a WorkflowState from a state file written by save_state, converting
+    only what serialization changed (enums, timestamps) instead of validating.
+    """
+    history = {
+        step_id: StepState.model_construct(
+            step_id=step["step_id"],
+            status=StateStatus(step.get("status", StateStatus.PENDING)),
+            output=step.get("output") or {},
+            error=step.get("error"),
+            started_at=parse_timestamp(step.get("started_at")),
+            completed_at=parse_timestamp(step.get("completed_at")),
+        )
+        for step_id, step in data.get("steps_history", {}).items()
+    }
+    return WorkflowState.model_construct(
+        task_id=data["task_id"],
+        workflow_ref=data["workflow_ref"],
+        status=StateStatus(data.get("status", StateStatus.PENDING)),
+        current_step_index=data.get("current_step_index", 0),
+        steps_history=history,
+        context_cache=data.get("context_cache") or {},
+        error=data.get("error"),
+    )
 
 class PersistenceManager:
     """Handles storage of flow state."""
     
     def __init__(self, root_dir: Path):
         self.state_dir = root_dir / ".flow_state"
+        # task_id -> (size, digest) of the state file as last read or written
+        self._last_saved: Dict[str, Tuple[int, bytes]] = {}
         self._ensure_dir()
 
     def _ensure_dir(self):
@@ -31,26 +67,50 @@ class PersistenceManager:
 
     def _get_path(self, task_id: str) -> Path:
         # Sanitize ID for filename
-        safe_id = task_id.replace(".", "_").replace("/", "_")
-        return self.state_dir / f"{safe_id}.state.json"
+        return self.state_dir / f"{task_id.translate(_SAFE_ID)}.state.json"
 
-    def load_state(self, task_id: str) -> Optional[WorkflowState]:
+    def load_state(self, task_id: str, strict: bool = False) -> Optional[WorkflowState]:
+        """
+        Loads the state of a task, None if it has none.
+        State files are only trusted as PersistenceManager output: they are
+        constructed without validation unless `strict` is set (e.g. for `validate`).
+        """
         path = self._get_path(task_id)
         if not path.exists():
             return None
             
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-            return WorkflowState(**data)
-        except (json.JSONDecodeError, ValidationError) as e:
+            raw = path.read_bytes()
+            if strict:
+                # Parsed and validated from the bytes in one pass (pydantic-core)
+                state = WorkflowState.model_validate_json(raw)
+            else:
+                state = _construct_state(json_loads(raw))
+            self._last_saved[task_id] = (len(raw), _digest(raw))
+            return state
+        except (ValueError, ValidationError, KeyError, TypeError, AttributeError) as e:
             # TODO: Log error or backup corrupt state?
             # For now, treat as non-existent (reset) or raise?
             # Raising is safer to prevent data loss.
             raise ValueError(f"Corrupt State File {path}: {e}")
 
     def save_state(self, state: WorkflowState):
+        """Writes the state file, unless it already holds exactly this state."""
         path = self._get_path(state.task_id)
-        path.write_text(
-            state.model_dump_json(indent=2),
-            encoding="utf-8"
-        )
+        # Compact JSON straight from pydantic-core (indenting cost ~70% more)
+        payload = state.model_dump_json().encode("utf-8")
+        fingerprint = (len(payload), _digest(payload))
+        if self._last_saved.get(state.task_id) == fingerprint:
+            # Unchanged since we read/wrote it; the size check catches a file
+            # removed or rewritten by someone else in the meantime
+            try:
+                if path.stat().st_size == fingerprint[0]:
+                    return
+            except FileNotFoundError:
+                pass
+        # Write a sibling file and rename it over the state, so a crash mid-write
+        # leaves the previous state intact instead of a corrupt file
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+        self._last_saved[state.task_id] = fingerprint
@@ -14,7 +14,8 @@
 
 from enum import Enum
 from typing import List, Dict, Optional, Union, Any
-from pydantic import BaseModel, Field
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_serializer, field_validator
 
 class StepType(str, Enum):
     ATOM = "atom"
@@ -35,6 +36,7 @@ class WorkflowStep(BaseModel):
     export: Optional[Dict[str, str]] = Field(default=None, description="Map internal output keys to global context keys")
     instructions: Optional[str] = Field(default=None, description="Template for the Mission Brief")
     description: Optional[str] = None
+    parallel: bool = Field(default=False, description="Run concurrently with adjacent steps that also set this (no data dependency between them)")
 
 class WorkflowDefinition(BaseModel):
     name: str
@@ -49,13 +51,36 @@ class StateStatus(str, Enum):
     FAILED = "FAILED"
     SKIPPED = "SKIPPED"
 
+def parse_timestamp(v: Any) -> Any:
+    """ISO-8601 string (naive means UTC) -> nanoseconds since the epoch; other values pass through."""
+    if isinstance(v, str):
+        dt = datetime.fromisoformat(v)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        seconds = int(dt.replace(microsecond=0).timestamp())
+        return seconds * 1_000_000_000 + dt.microsecond * 1_000
+    return v
+
 class StepState(BaseModel):
     step_id: str
     status: StateStatus = StateStatus.PENDING
     output: Dict[str, Any] = Field(default_factory=dict)
     error: Optional[str] = None
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+    # Nanoseconds since the epoch (time.time_ns()); ISO-8601 UTC strings on disk
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
+
+    @field_validator("started_at", "completed_at", mode="before")
+    @classmethod
+    def _parse_timestamp(cls, v: Any) -> Any:
+        return parse_timestamp(v)
+
+    @field_serializer("started_at", "completed_at")
+    def _format_timestamp(self, v: Optional[int]) -> Optional[str]:
+        if v is None:
+            return None
+        dt = datetime.fromtimestamp(v // 1_000_000_000, timezone.utc)
+        return dt.replace(microsecond=(v // 1_000) % 1_000_000).isoformat()
 
 class WorkflowState(BaseModel):
     task_id: str
@@ -64,3 +89,10 @@ class WorkflowState(BaseModel):
     current_step_index: int = 0
     steps_history: Dict[str, StepState] = Field(default_factory=dict)
     context_cache: Dict[str, Any] = Field(default_factory=dict)
+    # Errors reported by atoms' background work at the end of the last top-level run
+    error: Optional[str] = None
+
+    @property
+    def is_complete(self) -> bool:
+        """True once every step has run (set by the engine when its loop finishes)."""
+        return self.status == StateStatus.COMPLETED
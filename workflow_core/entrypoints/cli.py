@@ -74,6 +74,15 @@ def main():
             ctx = context_manager.get_current_context()
             print(f"   Active Task: {ctx.get('task_id', 'None')}")
             print(f"   Workflow: {ctx.get('workflow', 'None')}")
+            
+            # 4. Engine State Check (full schema validation of the state file)
+            if ctx.get('task_id'):
+                try:
+                    engine.persistence.load_state(ctx['task_id'], strict=True)
+                    logger.info("[V7] Engine State: OK")
+                except ValueError as e:
+                    logger.error(f"[V7] Engine State Validation Failed: {e}")
+                    sys.exit(1)
             return
 
         # For specific commands, ensure status valid
@@ -146,30 +155,14 @@ def main():
         print(f">> Workflow: {workflow_name}")
         
         # Run Engine
-        # Inject Initial Context (Config, Paths)
-        # Convert Pydantic config to dict if needed, or just specific keys
-        initial_context = config.dict()
-        initial_context["root"] = str(root)
-        initial_context["prefixes"] = config.prefixes # explicit
-        
-        # Get Active Status File Path
-        try:
-             status_obj = status_reader.parse()
-             initial_context["status_file"] = str(status_obj.file_path)
-        except:
-             initial_context["status_file"] = str(root / "status.md") # Fallback
-
-        # Merge with context manager context (task info)
-        initial_context.update(ctx)
-        
-        # We nest config under "config" key?
+        # Inject Initial Context (Config, Paths) plus the context manager's
+        # context (task info, status_file).
         # planning.json uses ${config.root}. So we need a "config" dict in context.
-        # Let's restructure.
         engine_context = {
             "config": {
                 "root": str(root),
                 "prompts": str(config_root.parent / "templates" / "prompts"), # Heuristic or Configured?
-                **config.dict()
+                **config.model_dump()
             },
             **ctx
         }
@@ -16,6 +16,14 @@ from pathlib import Path
 import re
 from typing import Dict, Any, List
 
+# Fractal headers: legacy "Level: 1" / "Parent-Link: [..](..)" and new "> **Planning Level**: 1" / "> **Parent**: [..](..)"
+_LEVEL_RE = re.compile(r"(?:Level:|> \*\*Planning Level\**:)\s*(\d+)", re.MULTILINE)
+_PARENT_RE = re.compile(r"(?:Parent-Link:|> \*\*Parent\**:)\s*\[.*?\]\((.*?)\)", re.MULTILINE)
+
+# Action items, one per line: "- **[ACTION] Title**: Description"
+# ([^\S\n] is whitespace that stays on the line)
+_ACTION_RE = re.compile(r"^[^\S\n]*-[^\S\n]*\*\*\[ACTION\][^\S\n]*(.*?)\*\*:", re.MULTILINE)
+
 class Context_Loader:
     """
     Parses a Markdown Plan to extract Fractal Metadata and Action Items.
@@ -33,10 +41,10 @@ class Context_Loader:
         
         # 1. Parse Headers
         # Support both Legacy "Level: 1" and New "> **Planning Level**: 1"
-        level_match = re.search(r"(?:Level:|> \*\*Planning Level\**:)\s*(\d+)", content, re.MULTILINE)
+        level_match = _LEVEL_RE.search(content)
         
         # Parent Link is now optional or part of "Top Down" context
-        parent_match = re.search(r"(?:Parent-Link:|> \*\*Parent\**:)\s*\[.*?\]\((.*?)\)", content, re.MULTILINE)
+        parent_match = _PARENT_RE.search(content)
         
         if not level_match:
              raise ValueError("Missing required Fractal Header: Level")
@@ -45,12 +53,8 @@ class Context_Loader:
         parent_link = parent_match.group(1) if parent_match else None
         
         # 2. Extract Action Items
-        # Pattern: - **[ACTION] Title**: Description
-        actions = []
-        for line in content.splitlines():
-            m = re.match(r"^\s*-\s*\*\*\[ACTION\]\s*(.*?)\*\*:", line)
-            if m:
-                actions.append(m.group(1).strip())
+        # Pattern: - **[ACTION] Title**: Description (one pass over the whole file)
+        actions = [m.group(1).strip() for m in _ACTION_RE.finditer(content)]
                 
         return {
             "fractal_level": fractal_level,
@@ -12,105 +12,158 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import ast
+import functools
+import heapq
 import json
 import os
 import pathlib
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, FrozenSet, Tuple
+
+from workflow_core.infrastructure.config.json_cache import load_json_cached
+
+def parse_list_arg(value: Any) -> Any:
+    """
+    Parses a list passed to an atom as a string (JSON or Python repr, e.g. from
+    context); any other string becomes a one-item list. Non-strings pass through.
+    """
+    if not isinstance(value, str):
+        return value
+    text = value.strip()
+    if not text.startswith('['):
+        return [value]
+    try:
+        return json.loads(text)
+    except ValueError:
+        try:
+            return ast.literal_eval(text)
+        except Exception:  # malformed literals raise more than ValueError/SyntaxError
+            return [value]
 
 # Helper to mock config loading
 def load_json_config(path: str) -> Dict[str, Any]:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """Parsed once per file version (path, mtime); callers must not mutate the result."""
+    return load_json_cached(path)
+
+@functools.lru_cache(maxsize=8)
+def _expert_activation_index(path: str, mtime_ns: int) -> Tuple[FrozenSet[str], Dict[str, Set[str]], Dict[str, Set[str]]]:
+    """
+    Inverts the Expert modules' activations once per modules.json version:
+    (always active roles, tag -> roles, task type -> roles).
+    """
+    always: Set[str] = set()
+    by_tag: Dict[str, Set[str]] = {}
+    by_task_type: Dict[str, Set[str]] = {}
+    for module in load_json_cached(path).get('Modules', []):
+        if module.get('Type') != 'Expert':
+            continue
+            
+        role = module.get('Role')
+        activation = module.get('Activation', {})
+        activations = activation if isinstance(activation, list) else [activation]
+        for act in activations:
+            if act.get('Always'):
+                always.add(role)
+            for tag in act.get('Tags', []):
+                by_tag.setdefault(tag, set()).add(role)
+            for task_type in act.get('TaskTypes', []):
+                by_task_type.setdefault(task_type, set()).add(role)
+    return frozenset(always), by_tag, by_task_type
 
 class Team_Builder:
     def execute(self, tags: List[str], context: str) -> List[str]:
         config_path = os.path.join(os.getcwd(), 'workflow_core/config/modules.json')
-        data = load_json_config(config_path)
-        
-        team: Set[str] = set()
+        always, by_tag, by_task_type = _expert_activation_index(config_path, os.stat(config_path).st_mtime_ns)
         
-        for module in data.get('Modules', []):
-            if module.get('Type') != 'Expert':
-                continue
-                
-            role = module.get('Role')
-            activation = module.get('Activation', {})
-            activations = []
-            if isinstance(activation, list):
-                activations = activation
-            else:
-                activations = [activation]
-
-            is_active = False
-            for act in activations:
-                # 1. Always Active
-                if act.get('Always'):
-                    is_active = True
-                    break
-                    
-                # 2. Tag Activation
-                module_tags = set(act.get('Tags', []))
-                if module_tags.intersection(tags):
-                    is_active = True
-                    break
-                    
-                # 3. Context/TaskType Activation
-                task_types = act.get('TaskTypes', [])
-                if context in task_types:
-                    is_active = True
-                    break
-            
-            if is_active:
-                team.add(role)
+        # An expert is active if it is Always active, shares a Tag, or lists the context as a TaskType
+        team: Set[str] = set(always)
+        for tag in tags:
+            team.update(by_tag.get(tag, ()))
+        team.update(by_task_type.get(context, ()))
             
         return list(team)
 
+@functools.lru_cache(maxsize=8)
+def _topic_index(path: str, mtime_ns: int) -> Dict[str, Dict[str, List[Tuple[int, str]]]]:
+    """
+    Inverts TopicResponsibilities once per core_topics.json version:
+    context -> role -> [(position, topic)], with topics open to "All" contexts under "All".
+    Positions keep the file order when two contexts' lists are merged.
+    """
+    index: Dict[str, Dict[str, List[Tuple[int, str]]]] = {"All": {}}
+    topics = load_json_cached(path).get('TopicResponsibilities', {})
+    for pos, (topic, criteria) in enumerate(topics.items()):
+        # Support V8 Schema (Dict with Roles/Contexts) and Legacy (List of Roles, or a single Role)
+        if isinstance(criteria, list):
+            roles = criteria
+            contexts = ["All"]
+        elif isinstance(criteria, str):
+            roles = [criteria]
+            contexts = ["All"]
+        else:
+            roles = criteria.get('Roles', [])
+            contexts = criteria.get('Contexts', ["All"])
+            
+        # "All" matches everything; otherwise the topic is listed under each exact context
+        for ctx in (["All"] if "All" in contexts else set(contexts)):
+            by_role = index.setdefault(ctx, {})
+            for role in roles:
+                by_role.setdefault(role, []).append((pos, topic))
+    return index
+
 class Topic_Builder:
     def execute(self, team: List[str], context: str) -> Dict[str, List[str]]:
         config_path = os.path.join(os.getcwd(), 'workflow_core/config/core_topics.json')
-        data = load_json_config(config_path)
+        index = _topic_index(config_path, os.stat(config_path).st_mtime_ns)
         
-        assignments: Dict[str, List[str]] = {role: [] for role in team}
+        # Topics for "All" contexts plus those for this context, in file order
+        for_all = index["All"]
+        for_context = index.get(context, {}) if context != "All" else {}
         
-        for topic, criteria in data.get('TopicResponsibilities', {}).items():
-            # Support V8 Schema (Dict with Roles/Contexts) and Legacy (List of Roles)
-            if isinstance(criteria, list):
-                roles = criteria
-                contexts = ["All"]
-            else:
-                roles = criteria.get('Roles', [])
-                contexts = criteria.get('Contexts', ["All"])
-                
-            # Check Context Filter
-            # Matches if "All" is present OR context matches exactly OR context matches a partial key?
-            # Proposal: "Code" matches "Code", "All" matches everything.
-            if "All" not in contexts and context not in contexts:
-                continue
-                
-            # Assign to Roles
-            for role in roles:
-                if role in team:
-                    assignments[role].append(topic)
+        assignments: Dict[str, List[str]] = {}
+        for role in team:
+            assignments[role] = [
+                topic for _, topic in heapq.merge(for_all.get(role, ()), for_context.get(role, ()))
+            ]
                     
         return assignments
 
+# (root_path, prefix) -> matching sub-directory. Only hits are kept, and each is
+# re-checked before use: a fallback could hide a directory created later, and a
+# directory mtime is too coarse to notice every change.
+_PREFIXED_DIRS: Dict[Tuple[str, str], str] = {}
+_PREFIXED_DIRS_MAX = 256
+
+def _find_prefixed_dir(root_path: str, prefix: str) -> str:
+    """First sub-directory of root_path whose name starts with prefix (root_path if none)."""
+    key = (root_path, prefix)
+    cached = _PREFIXED_DIRS.get(key)
+    if cached is not None and os.path.isdir(cached):
+        return cached
+    
+    # Scan for matching folder (a missing root is one failed open, not an extra stat)
+    try:
+        it = os.scandir(root_path)
+    except FileNotFoundError:
+        return root_path
+    with it:
+        for entry in it:
+            # Name check first: is_dir() may need a stat
+            if entry.name.startswith(prefix) and entry.is_dir():
+                if len(_PREFIXED_DIRS) >= _PREFIXED_DIRS_MAX:
+                    _PREFIXED_DIRS.pop(next(iter(_PREFIXED_DIRS)), None)
+                _PREFIXED_DIRS[key] = entry.path
+                return entry.path
+                
+    return root_path
+
 class Artifact_Resolver:
     def execute(self, task_id: str, root_path: str) -> str:
-        parts = task_id.split('.')
+        # Only the first two parts matter
+        parts = task_id.split('.', 2)
         if len(parts) < 2:
             return root_path
             
         # Parent ID logic: 4.3.5 -> 4.3 -> "4_3" prefix
-        parent_id = f"{parts[0]}.{parts[1]}"
-        prefix = parent_id.replace('.', '_')
-        
-        if not os.path.exists(root_path):
-             return root_path
-
-        # Scan for matching folder
-        with os.scandir(root_path) as it:
-            for entry in it:
-                if entry.is_dir() and entry.name.startswith(prefix):
-                    return entry.path
-                    
-        return root_path
+        prefix = f"{parts[0]}_{parts[1]}"
+        return _find_prefixed_dir(root_path, prefix)
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from typing import Dict, Any
-from workflow_core.flow_manager.atoms.review_logic import Team_Builder
+from workflow_core.flow_manager.atoms.review_logic import Team_Builder, parse_list_arg
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Any:
     """
@@ -25,20 +25,9 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Any:
     atom = Team_Builder()
     
     # Handle direct args or injection
-    tags = args.get("tags", [])
-    if isinstance(tags, str):
-        # Determine if it's a JSON string or need parsing
-        import json
-        import ast
-        try:
-            tags = json.loads(tags)
-        except:
-             try:
-                 tags = ast.literal_eval(tags)
-             except:
-                 tags = [tags]
-             
-    # If tags passed as "list" object from engine context, it might be list
+    # If tags passed as "list" object from engine context, it might be list;
+    # a string is a JSON list, a Python repr or a single tag
+    tags = parse_list_arg(args.get("tags", []))
     
     review_context = args.get("context", "Analysis")
     
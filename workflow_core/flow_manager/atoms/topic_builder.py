@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from typing import Dict, Any, List
-from workflow_core.flow_manager.atoms.review_logic import Topic_Builder
+from workflow_core.flow_manager.atoms.review_logic import Topic_Builder, parse_list_arg
 
 def run(args: Dict[str, Any], context: Dict[str, Any]) -> Any:
     """
@@ -21,18 +21,8 @@ def run(args: Dict[str, Any], context: Dict[str, Any]) -> Any:
     """
     atom = Topic_Builder()
     
-    team = args.get("team", [])
     # Parse team if it's a string (Handle Python repr)
-    if isinstance(team, str):
-        import json
-        import ast
-        try:
-            team = json.loads(team)
-        except:
-            try:
-                team = ast.literal_eval(team)
-            except:
-                team = [team]
+    team = parse_list_arg(args.get("team", []))
 
     review_context = args.get("context", "Analysis")
     
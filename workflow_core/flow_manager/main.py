@@ -16,7 +16,6 @@ import argparse
 import sys
 import logging
 from logging.handlers import RotatingFileHandler
-import re
 from pathlib import Path
 import shutil
 
@@ -27,7 +26,7 @@ if __name__ == "__main__":
         sys.path.insert(0, str(root))
 
 from workflow_core.engine.core.engine import WorkflowEngine
-from workflow_core.flow_manager.status_parser import StatusParser, StatusParsingError
+from workflow_core.flow_manager.status_parser import StatusParser, StatusParsingError, task_id_pattern
 
 def main():
     parser = argparse.ArgumentParser(description="Gemini Flow Manager V7")
@@ -196,11 +195,9 @@ def perform_reset(task_id: str, parser: StatusParser) -> bool:
     new_lines = []
     found = False
     
-    # Regex for finding the task line to reset.
+    # Regex for finding the task line to reset (compiled once per ID).
     # Must match indentation, marker, ID (with optional dot), and rest.
-    escaped_id = re.escape(task_id)
-    # Pattern: indent - [marker] ID(dot?) rest
-    pattern = re.compile(rf"^(\s*)- \[(.| )\] {escaped_id}(\.?)\s+(.*)")
+    pattern = task_id_pattern(task_id)
     
     for line in lines:
         match = pattern.match(line)
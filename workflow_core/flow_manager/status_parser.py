@@ -12,11 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import hashlib
 import re
 import json
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Set
+from typing import Optional, Dict, Any, List, Set, Tuple
+
+# Valid task line: "- [ ] 1.2.3 Rest"
+# Groups: 1=indent, 2=mark, 3=id, 4=rest
+_TASK_RE = re.compile(r"^(\s*)- \[(.| )\] (\d+(?:\.\d+)*)\.?\s+(.*)")
+
+# Active task line: "- [/] 1.2.3 Rest"
+# Groups: 1=indent, 2=id, 3=rest
+_ACTIVE_RE = re.compile(r"^(\s*)- \[\/\] (\d+(?:\.\d+)*)\.?\s+(.*)")
+
+# Task name prefix: "Impl.Feature: ..." or "Impl ..."
+_PREFIX_RE = re.compile(r"^([A-Za-z]+(?:\.[A-Za-z]+)?)(?::|\s)")
+
+@functools.lru_cache(maxsize=128)
+def task_id_pattern(task_id: str) -> "re.Pattern[str]":
+    """Task line for one specific ID (compiled once per ID)."""
+    return re.compile(rf"^(\s*)- \[(.)\] ({re.escape(task_id)})\.?\s+(.*)")
 
 class StatusParsingError(Exception):
     pass
@@ -29,6 +47,10 @@ class StatusParser:
         start = start_path or Path.cwd()
         self.root = self._find_root(start)
         self.status_file = self._find_status_file()
+        # (content digest, lines) of the status file as last read, and the
+        # digest last found valid by validate_structure
+        self._lines_cache: Optional[Tuple[bytes, List[str]]] = None
+        self._validated_key: Optional[bytes] = None
 
     def _load_config(self) -> Dict[str, Any]:
         """Loads flow_config.json from config directory."""
@@ -102,6 +124,17 @@ class StatusParser:
             
         return None
 
+    def _read_lines(self) -> Tuple[bytes, List[str]]:
+        """
+        Returns (content digest, lines) of the status file, splitting it into
+        lines only when the content changed. Callers must not mutate the lines.
+        """
+        raw = self.status_file.read_bytes()
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        if self._lines_cache is None or self._lines_cache[0] != key:
+            self._lines_cache = (key, raw.decode('utf-8').splitlines())
+        return self._lines_cache
+
     def validate_structure(self) -> None:
         """
         Strictly validates the status file structure.
@@ -110,12 +143,10 @@ class StatusParser:
         if not self.status_file:
             raise StatusParsingError("No status.md found")
 
-        content = self.status_file.read_text(encoding='utf-8')
-        lines = content.splitlines()
-        
-        # Regex for valid task line: "- [ ] 1.2.3 Rest"
-        # Groups: 1=indent, 2=mark, 3=id, 4=rest
-        task_pattern = re.compile(r"^(\s*)- \[(.| )\] (\d+(?:\.\d+)*)\.?\s+(.*)")
+        key, lines = self._read_lines()
+        if key == self._validated_key:
+            # Unchanged since it last passed
+            return
         
         active_tasks = []
         seen_ids = set()
@@ -125,7 +156,7 @@ class StatusParser:
             if not line.strip():
                 continue
                 
-            match = task_pattern.match(line)
+            match = _TASK_RE.match(line)
             if match:
                 indent, mark, task_id, rest = match.groups()
                 
@@ -164,6 +195,8 @@ class StatusParser:
         # Rule 3 Check
         if len(active_tasks) > 1:
             raise StatusParsingError(f"Multiple active tasks found: {active_tasks}. context slicing requires single-task focus.")
+        
+        self._validated_key = key
 
     def _validate_prefix_defined(self, prefix: str, line_num: int):
         """
@@ -202,13 +235,10 @@ class StatusParser:
         except StatusParsingError as e:
             return {"error": str(e), "workflow": "Phase.Planning"}
 
-        content = self.status_file.read_text(encoding='utf-8')
-        lines = content.splitlines()
-        
-        task_pattern = re.compile(r"^(\s*)- \[\/\] (\d+(?:\.\d+)*)\.?\s+(.*)")
+        _, lines = self._read_lines()
         
         for line in lines:
-            match = task_pattern.match(line)
+            match = _ACTIVE_RE.match(line)
             if match:
                 indent, task_id, raw_name = match.groups()
                 name = raw_name.strip()
@@ -230,7 +260,7 @@ class StatusParser:
     def _extract_prefix(self, name: str) -> Optional[str]:
         # e.g. "Impl.Feature: Create ..." -> prefix="Impl.Feature"
         # Also supports simple "Impl: ..."
-        prefix_match = re.match(r"^([A-Za-z]+(?:\.[A-Za-z]+)?)(?::|\s)", name)
+        prefix_match = _PREFIX_RE.match(name)
         return prefix_match.group(1) if prefix_match else None
 
     def _determine_workflow(self, prefix: Optional[str]) -> str:
@@ -273,11 +303,9 @@ class StatusParser:
         if not self.status_file:
             return {"error": "No status.md found"}
 
-        content = self.status_file.read_text(encoding='utf-8')
-        lines = content.splitlines()
+        _, lines = self._read_lines()
         
-        escaped_id = re.escape(task_id)
-        pattern = re.compile(rf"^(\s*)- \[(.)\] ({escaped_id})\.?\s+(.*)")
+        pattern = task_id_pattern(task_id)
         
         for line in lines:
             match = pattern.match(line)
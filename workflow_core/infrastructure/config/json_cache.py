@@ -0,0 +1,46 @@
+# Copyright 2026 Steve Bula @ pitBula
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    # Optional C-accelerated parser; stdlib json.loads also accepts raw bytes
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+_RAISE = object()
+
+@functools.lru_cache(maxsize=32)
+def _read_json(path: str, mtime_ns: int) -> Any:
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+def load_json_cached(path: Union[str, Path], default: Any = _RAISE) -> Any:
+    """
+    Parses a JSON file once per version (path, st_mtime_ns); callers must not
+    mutate the result. A missing file returns `default` if given, else raises
+    FileNotFoundError.
+    """
+    path = os.fspath(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        if default is _RAISE:
+            raise
+        return default
+    return _read_json(path, mtime_ns)
@@ -17,13 +17,15 @@ import os
 import re
 from pathlib import Path
 
-def check_review_completeness(file_path, ignore_pending=False, check_verdict=True):
+def check_review_completeness(file_path, ignore_pending=False, check_verdict=True, content=None):
+    # `content`: the report text if the caller already read it (skips the re-read)
     path = Path(file_path)
-    if not path.exists():
-        print(f"[FAIL] Report not found: {path}")
-        return False
+    if content is None:
+        if not path.exists():
+            print(f"[FAIL] Report not found: {path}")
+            return False
 
-    content = path.read_text(encoding='utf-8')
+        content = path.read_text(encoding='utf-8')
 
     # 1. Split into Blocks
     reviewer_blocks = content.split("### Reviewer:")[1:] # Skip preamble
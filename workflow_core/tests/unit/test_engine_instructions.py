@@ -23,10 +23,11 @@ class MockExecutor:
         self.registry = registry
         self.last_call = None
 
-    def execute_step(self, step_def: WorkflowStep, context: Dict[str, Any]):
+    def execute_step(self, step_def: WorkflowStep, context: Dict[str, Any], **resolved):
         self.last_call = {
             "step_def": step_def,
-            "context": context
+            "context": context,
+            **resolved
         }
         return {"status": "DONE"}
 
@@ -20,8 +20,10 @@ from unittest.mock import MagicMock, patch
 
 @pytest.fixture
 def mock_template_factory():
-    with patch("workflow_core.engine.atoms.expert_sequencer.TemplateFactory") as mock:
-        yield mock
+    with patch("workflow_core.engine.atoms.render_template.TemplateFactory") as mock:
+        # Drop the shared module-level factory so the mock is used
+        with patch("workflow_core.engine.atoms.render_template._FACTORY", None):
+            yield mock
 
 @pytest.fixture
 def review_file(tmp_path):
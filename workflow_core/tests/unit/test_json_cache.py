@@ -0,0 +1,36 @@
+# Copyright 2026 Steve Bula @ pitBula
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pytest
+from workflow_core.infrastructure.config.json_cache import load_json_cached
+
+def test_load_json_cached_reuses_until_file_changes(tmp_path):
+    """The parse is shared per file version and redone once the mtime moves."""
+    path = tmp_path / "teams.json"
+    path.write_bytes(b'{"a": 1}')
+    first = load_json_cached(path)
+    assert first == {"a": 1}
+    assert load_json_cached(str(path)) is first
+
+    path.write_bytes(b'{"a": 2}')
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_json_cached(path) == {"a": 2}
+
+def test_load_json_cached_missing_file(tmp_path):
+    missing = tmp_path / "missing.json"
+    assert load_json_cached(missing, {}) == {}
+    with pytest.raises(FileNotFoundError):
+        load_json_cached(missing)
@@ -0,0 +1,41 @@
+# Copyright 2026 Steve Bula @ pitBula
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pytest
+from workflow_core.engine.core.rules_engine import RulesEngine
+
+@pytest.fixture
+def engine(tmp_path):
+    (tmp_path / "rules.json").write_text(json.dumps({"Rules": {"AuthorRole": [
+        {"Tags": ["ML", "AI"], "Result": "ML Engineer"},
+        {"Tags": ["Security", "AI"], "Result": "Security"},
+        {"ServiceType": "Engine", "Result": "Core Dev"},
+        {"ServiceType": "Engine", "Result": "Shadowed"},
+        {"Default": True, "Result": "Backend Dev"}
+    ]}}))
+    return RulesEngine(tmp_path)
+
+@pytest.mark.parametrize("service_type, tags, expected", [
+    ("Engine", ["Security", "ML"], "ML Engineer"),  # earliest matching rule, not first tag
+    ("Engine", ["AI"], "ML Engineer"),
+    ("Engine", ["Other"], "Core Dev"),
+    ("Service", [], "Backend Dev"),
+])
+def test_resolve_priority(engine, service_type, tags, expected):
+    """Tags beat ServiceType beats Default; the first rule in the file wins ties."""
+    assert engine.resolve_author_role(service_type, tags) == expected
+
+def test_resolve_unknown_rule_type(engine):
+    assert engine.resolve_council_set("Engine", []) == "Unknown"
@@ -73,6 +73,20 @@ def test_validate_structure_multiple_active(mock_repo):
     with pytest.raises(StatusParsingError, match="Multiple active tasks"):
         parser.validate_structure()
 
+def test_validate_structure_rechecks_same_size_edit(mock_repo):
+    """A same-size edit within one mtime tick is validated again, not skipped."""
+    import os
+    p = mock_repo / "status.md"
+    p.write_text("- [/] 1. Plan.A\n- [ ] 2. Plan.B\n", encoding="utf-8")
+    st = p.stat()
+    parser = StatusParser(mock_repo)
+    parser.validate_structure()
+
+    p.write_text("- [/] 1. Plan.A\n- [/] 2. Plan.B\n", encoding="utf-8")
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns))
+    with pytest.raises(StatusParsingError, match="Multiple active tasks"):
+        parser.validate_structure()
+
 def test_smart_dispatch_planning(mock_repo):
     p = mock_repo / "status.md"
     p.write_text("- [/] 1. Plan.Arch: Design something")
@@ -12,9 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pytest
 from workflow_core.core.context.models import Task, StatusFile
-from workflow_core.core.context.status_reader import StatusFile as RealStatusFile
+from workflow_core.core.context.status_reader import StatusFile as RealStatusFile, StatusReader, StatusReaderError
+from workflow_core.infrastructure.config.loader import FlowConfig
 
 # Mock Model Helper
 def create_task(id, mark, name="Test Task"):
@@ -73,3 +75,95 @@ class TestStatusReaderLogic:
         
         assert t1.is_completed is True
         assert t2.is_completed is False
+
+class TestStatusReaderUpdates:
+
+    @pytest.fixture
+    def reader(self, tmp_path):
+        config = FlowConfig(root_markers=[], prefixes={}, status_files=["status.md"], backup_count=2)
+        return StatusReader(config, tmp_path)
+
+    def test_update_status_bulk_single_backup(self, reader, tmp_path):
+        """Bulk update rewrites all marks with one backup rotation."""
+        status = tmp_path / "status.md"
+        status.write_text("- [ ] 1. Parent\n  - [/] 1.1. Child\n  - [ ] 1.2 Other", encoding="utf-8")
+
+        assert reader.update_status_bulk(status, {"1.1": "x", "1.2": "x"}) is True
+
+        assert status.read_text(encoding="utf-8") == "- [ ] 1. Parent\n  - [x] 1.1. Child\n  - [x] 1.2 Other"
+        assert (tmp_path / "status.md.bak").exists()
+        assert not (tmp_path / "status.md.bak.1").exists()
+
+    def test_update_status_bulk_no_match_skips_backup(self, reader, tmp_path):
+        """No matching task: neither the file nor the backups are touched."""
+        status = tmp_path / "status.md"
+        status.write_text("- [ ] 1. Parent", encoding="utf-8")
+
+        assert reader.update_status(status, "9", "x") is False
+        assert not (tmp_path / "status.md.bak").exists()
+
+    def test_cascade_completion(self, reader, tmp_path):
+        """Parents whose children are all done are completed bottom-up."""
+        status = tmp_path / "status.md"
+        status.write_text(
+            "- [ ] 1. Root\n"
+            "  - [ ] 1.1. Group\n"
+            "    - [x] 1.1.1. Leaf\n"
+            "  - [x] 1.2. Leaf\n"
+            "- [ ] 2. Open\n"
+            "  - [ ] 2.1. Leaf",
+            encoding="utf-8"
+        )
+
+        assert reader.cascade_completion(status) is True
+
+        marks = {t.id: t.mark for t in reader.parse(status).tasks}
+        assert marks == {"1": "x", "1.1": "x", "1.1.1": "x", "1.2": "x", "2": " ", "2.1": " "}
+
+    def test_parse_reuses_result_until_file_changes(self, reader, tmp_path):
+        """Unchanged file: callers get independent copies; own updates are seen at once."""
+        status = tmp_path / "status.md"
+        status.write_text("- [ ] 1. Task", encoding="utf-8")
+
+        first = reader.parse(status)
+        first.tasks[0].mark = "x"
+        first.tasks.clear()
+        second = reader.parse(status)
+        assert second is not first
+        assert [(t.id, t.mark) for t in second.tasks] == [("1", " ")]
+
+        reader.update_status(status, "1", "x")
+        assert reader.parse(status).tasks[0].mark == "x"
+
+    def test_parse_sees_same_size_edit_in_same_tick(self, reader, tmp_path):
+        """An external edit keeping size and mtime is still picked up."""
+        status = tmp_path / "status.md"
+        status.write_text("- [ ] 1. Task", encoding="utf-8")
+        st = status.stat()
+        assert reader.parse(status).tasks[0].mark == " "
+
+        status.write_text("- [/] 1. Task", encoding="utf-8")
+        os.utime(status, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert reader.parse(status).tasks[0].mark == "/"
+
+    def test_parse_multibyte_mark_strict_error(self, reader, tmp_path):
+        """A non-ASCII mark is still a task line and fails the strict mark check."""
+        status = tmp_path / "status.md"
+        status.write_text("- [ ] 1 A\n- [✓] 2 B\n", encoding="utf-8")
+
+        with pytest.raises(StatusReaderError, match="Invalid Task Mark '✓' on line 2"):
+            reader.parse(status)
+
+    def test_parse_crlf_matches_lf(self, reader, tmp_path):
+        """CRLF files parse exactly like LF files (names, ids, line numbers)."""
+        text = "# Plan\n- [x] 1. Root\n  - [/] 1.1 Child\n  - [ ] 1.2 \n"
+        lf = tmp_path / "lf.md"
+        lf.write_bytes(text.encode("utf-8"))
+        crlf = tmp_path / "crlf.md"
+        crlf.write_bytes(text.replace("\n", "\r\n").encode("utf-8"))
+
+        expected = [t.model_dump() for t in reader.parse(lf).tasks]
+        assert [t.model_dump() for t in reader.parse(crlf).tasks] == expected
+        assert [(t.id, t.name, t.line_number) for t in reader.parse(crlf).tasks] == [
+            ("1", "Root", 2), ("1.1", "Child", 3), ("1.2", "", 4)
+        ]
@@ -53,3 +53,35 @@ def test_expert_loop_review_gate(mock_render, mock_query):
     
     assert result["status"] == "BLOCKED"
     assert result["reviews"]["#Sec"] == "[ ] Reject: bad"
+
+@patch("workflow_core.engine.atoms.expert_loop.agent.query")
+@patch("workflow_core.engine.atoms.expert_loop.prompt.render_string")
+def test_expert_loop_research_parallel_keeps_order(mock_render, mock_query):
+    """Research queries run concurrently but results stay keyed per expert."""
+    mock_render.side_effect = lambda tpl, ctx: f"Prompt for {ctx['role']}"
+    mock_query.side_effect = lambda p: p.replace("Prompt", "Answer")
+
+    experts = ["#Quant", "#Sec", "#Ops"]
+    result = expert_loop.run(
+        {"experts": experts, "mode": "research", "prompt_template": "dummy_template"},
+        {}
+    )
+
+    assert mock_query.call_count == 3
+    assert list(result["results"]) == experts
+    assert result["results"]["#Sec"] == "Answer for #Sec"
+
+@patch("workflow_core.engine.atoms.expert_loop.agent.query")
+@patch("workflow_core.engine.atoms.expert_loop.prompt.render_string")
+def test_expert_loop_review_stops_at_first_blocker(mock_render, mock_query):
+    """Review mode stops querying once an expert blocks."""
+    mock_query.side_effect = ["[ ] Reject: bad", "[x] Approve"]
+
+    result = expert_loop.run(
+        {"experts": ["#Sec", "#Quant"], "mode": "review", "prompt_template": "dummy_template"},
+        {}
+    )
+
+    assert result["status"] == "BLOCKED"
+    assert mock_query.call_count == 1
+    assert "#Quant" not in result["results"]
@@ -50,3 +50,11 @@ def test_no_active_task(tmp_path):
 """, encoding="utf-8")
     result = manifest.parse(f)
     assert result["active_task"] is None
+
+def test_crlf_matches_lf(mock_status_file, tmp_path):
+    """CRLF status files yield the same requirements and active task as LF ones."""
+    crlf = tmp_path / "status_crlf.md"
+    crlf.write_bytes(mock_status_file.read_bytes().replace(b"\n", b"\r\n"))
+    result = manifest.parse(crlf)
+    assert result["requirements"] == ["Low Latency", "Strict Types"]
+    assert result == manifest.parse(mock_status_file)
@@ -41,3 +41,11 @@ def test_render_missing_variable():
     # Let's assert it returns empty string (standard jinja2) unless we configure StrictUndefined
     result = prompt.render_string(tpl, ctx)
     assert result == "Hello " 
+
+def test_render_string_reuses_compiled_template():
+    """Repeated renders of the same source compile once."""
+    tpl = "Role: {{ role }} (cache check)"
+    assert prompt.render_string(tpl, {"role": "A"}) == "Role: A (cache check)"
+    hits = prompt._compile.cache_info().hits
+    assert prompt.render_string(tpl, {"role": "B"}) == "Role: B (cache check)"
+    assert prompt._compile.cache_info().hits == hits + 1
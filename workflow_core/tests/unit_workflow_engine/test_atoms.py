@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+import shlex
+import sys
 import pytest
 from unittest.mock import MagicMock, patch
-from workflow_core.engine.atoms import run_command, wait_approval, render_template, git_command
+from workflow_core.engine.atoms import run_command, wait_approval, render_template, git_command, state_update, wait_cli
 
 def test_run_command_success():
     """Test successful command execution."""
@@ -27,6 +30,81 @@ def test_run_command_success():
         assert res["status"] == "DONE"
         assert res["stdout"] == "Hello"
 
+def test_run_command_output_file(tmp_path):
+    """Test command output is written to the Markdown report and returned."""
+    report = tmp_path / "reports" / "out.md"
+    res = run_command.run({
+        "command": f"{shlex.quote(sys.executable)} -c \"import sys; print('hello'); sys.stderr.write('oops')\"",
+        "output_file": str(report),
+        "description": "Greeting"
+    }, {})
+    
+    assert res["status"] == "DONE"
+    assert res["stdout"] == "hello\n"
+    assert res["stderr"] == "oops"
+    assert res["output_file"] == str(report)
+    text = report.read_text(encoding="utf-8")
+    assert "## Greeting" in text
+    assert "> Status: DONE" in text
+    assert "```\nhello\n\n```" in text
+    assert "**Standard Error**:\n```\noops\n```" in text
+
+def test_run_command_report_reuses_and_reopens_file(tmp_path):
+    """Test shared report files: append, overwrite and replacement on disk."""
+    report = tmp_path / "out.md"
+    args = {"command": "echo one", "output_file": str(report), "description": "Step"}
+    try:
+        run_command.run(args, {})
+        run_command.run(args, {})
+        assert report.read_text(encoding="utf-8").count("## Step") == 2
+        
+        run_command.run({**args, "output_mode": "overwrite"}, {})
+        assert report.read_text(encoding="utf-8").count("## Step") == 1
+        
+        # Replaced on disk: the cached descriptor must not write to the old file
+        report.unlink()
+        run_command.run(args, {})
+        assert report.read_text(encoding="utf-8").count("## Step") == 1
+    finally:
+        assert run_command.finalize() == []
+
+def test_run_command_reports_from_parallel_steps(tmp_path):
+    """Test concurrent commands write only to their own reports and leak no descriptors."""
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    fd_dir = "/proc/self/fd"
+    open_fds = (lambda: len(os.listdir(fd_dir))) if os.path.isdir(fd_dir) else (lambda: 0)
+    before = open_fds()
+    names = [f"r{i}" for i in range(run_command.MAX_OPEN_REPORTS * 2)]
+
+    def step(name):
+        return run_command.run({"command": f"echo {name}", "output_file": str(tmp_path / f"{name}.md"), "description": name}, {})
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(step, names * 4))
+    assert run_command.finalize() == []
+
+    assert all(r["status"] == "DONE" for r in results)
+    for name in names:
+        text = (tmp_path / f"{name}.md").read_text(encoding="utf-8")
+        assert text.count(f"## {name}\n") == 4
+        assert text.count("## ") == 4
+    assert open_fds() == before
+
+def test_run_command_report_in_use_is_not_evicted(tmp_path):
+    """Test a descriptor being written to stays open while other reports churn the cache."""
+    import os
+    busy = tmp_path / "busy.md"
+    try:
+        with run_command._report_fd(busy) as fd:
+            for i in range(run_command.MAX_OPEN_REPORTS + 2):
+                with run_command._report_fd(tmp_path / f"other{i}.md") as other:
+                    os.write(other, b"x")
+            os.write(fd, b"still mine")
+        assert busy.read_bytes() == b"still mine"
+        assert all((tmp_path / f"other{i}.md").read_bytes() == b"x" for i in range(run_command.MAX_OPEN_REPORTS + 2))
+    finally:
+        assert run_command.finalize() == []
+
 def test_wait_approval_missing_file(tmp_path):
     """Test waiting for non-existent file."""
     target = tmp_path / "review.md"
@@ -40,6 +118,17 @@ def test_wait_approval_success(tmp_path):
     res = wait_approval.run({"target_file": str(target), "marker": "[x] APPROVE"}, {})
     assert res["status"] == "DONE"
 
+def test_wait_approval_rechecks_changed_file(tmp_path):
+    """Test a cached approval is dropped once the file changes."""
+    target = tmp_path / "review.md"
+    args = {"target_file": str(target), "marker": "[x] APPROVE"}
+    target.write_text("[x] APPROVE")
+    assert wait_approval.run(args, {})["status"] == "DONE"
+    assert wait_approval.run(args, {})["status"] == "DONE"
+    
+    target.write_text("[ ] APPROVE, reopened")
+    assert wait_approval.run(args, {})["status"] == "WAITING"
+
 @patch("workflow_core.engine.atoms.render_template.TemplateFactory")
 def test_render_template_mock(mock_factory_cls, tmp_path):
     """Test render template calls factory."""
@@ -59,6 +148,37 @@ def test_render_template_mock(mock_factory_cls, tmp_path):
     assert res["status"] == "DONE"
     assert target.read_text(encoding="utf-8") == "Rendered Content"
 
+def test_render_template_append_skips_duplicate(tmp_path):
+    """Test expert panel append is done once and leaves prior content intact."""
+    factory = MagicMock()
+    factory.modules = [{"Type": "Expert"}]
+    factory.generate_from_modules.return_value = "## Expert A\nbody"
+    target = tmp_path / "Review.md"
+    target.write_text("# Review\n", encoding="utf-8")
+    
+    with patch("workflow_core.engine.atoms.render_template.get_factory", return_value=factory):
+        args = {"template_name": "Expert_Panel_Dynamic", "target_file": str(target)}
+        first = render_template.run(args, {})
+        second = render_template.run(args, {})
+    
+    assert first["message"].startswith("Appended")
+    assert "Skipped Append" in second["message"]
+    assert target.read_text(encoding="utf-8") == "# Review\n\n\n## Expert A\nbody"
+
+def test_render_template_append_skips_duplicate_crlf(tmp_path):
+    """Test a panel already present in a CRLF file is not appended again."""
+    factory = MagicMock()
+    factory.modules = [{"Type": "Expert"}]
+    factory.generate_from_modules.return_value = "## Expert A\nbody"
+    target = tmp_path / "Review.md"
+    target.write_bytes(b"# Review\r\n\r\n\r\n## Expert A\r\nbody")
+
+    with patch("workflow_core.engine.atoms.render_template.get_factory", return_value=factory):
+        res = render_template.run({"template_name": "Expert_Panel_Dynamic", "target_file": str(target)}, {})
+
+    assert "Skipped Append" in res["message"]
+    assert target.read_bytes() == b"# Review\r\n\r\n\r\n## Expert A\r\nbody"
+
 def test_git_command_commit():
     """Test git commit action."""
     with patch("subprocess.run") as mock_run:
@@ -72,5 +192,125 @@ def test_git_command_commit():
         }, {})
         
         assert res["status"] == "DONE"
-        # Verify calls?
-        assert mock_run.call_count >= 2 # add, commit
+        # add + commit run as one chained shell invocation
+        assert mock_run.call_count == 1
+        script = mock_run.call_args[0][0][2]
+        assert "git add -- foo.py" in script
+        assert "git commit -m 'feat: test'" in script
+
+def test_git_command_add_all_keeps_repo_config():
+    """Whole-tree add does not override the repository's git config."""
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value.returncode = 0
+        assert git_command.run({"action": "commit", "message": "m"}, {})["status"] == "DONE"
+        script = mock_run.call_args[0][0][2]
+        assert script.startswith("git add -- .\n")
+        assert "-c " not in script
+
+def test_git_command_commit_push_real_repo(tmp_path, monkeypatch):
+    """commit_push commits synchronously; the push (no remote) fails in the background."""
+    import subprocess
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "t@example.com"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.name", "t"], cwd=tmp_path, check=True)
+    (tmp_path / "a.txt").write_text("a")
+    monkeypatch.chdir(tmp_path)
+
+    res = git_command.run({"action": "commit_push", "message": "it's done", "files": ["a.txt"]}, {})
+    assert res["status"] == "DONE"
+    errors = git_command.finalize()
+    assert len(errors) == 1 and errors[0].startswith("Git push failed")
+
+    log = subprocess.run(["git", "log", "--format=%s"], cwd=tmp_path, capture_output=True, text=True)
+    assert log.stdout.strip() == "it's done"
+
+    # Nothing staged: commit is a no-op, not a failure
+    assert git_command.run({"action": "commit", "message": "again"}, {})["status"] == "DONE"
+
+def test_git_command_uses_engine_cwd(tmp_path):
+    """Git runs in the engine's working directory, not the process's."""
+    import subprocess
+    from workflow_core.engine.core.executor import AtomExecutor
+    from workflow_core.engine.schemas.models import WorkflowStep
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.email", "t@example.com"], cwd=tmp_path, check=True)
+    subprocess.run(["git", "config", "user.name", "t"], cwd=tmp_path, check=True)
+    (tmp_path / "a.txt").write_text("a")
+
+    executor = AtomExecutor({"Atoms": {"Git_Operation": {"python_module": "workflow_core.engine.atoms.git_command"}}})
+    executor.cwd = str(tmp_path)
+    step = WorkflowStep(id="g", type="atom", ref="Git_Operation",
+                        args={"action": "commit_push", "message": "engine cwd", "files": ["a.txt"]})
+    assert executor.execute_step(step, {})["status"] == "DONE"
+    errors = executor.finalize()
+    assert len(errors) == 1 and errors[0].startswith("Git push failed")
+
+    log = subprocess.run(["git", "log", "--format=%s"], cwd=tmp_path, capture_output=True, text=True)
+    assert log.stdout.strip() == "engine cwd"
+
+def test_state_update_values():
+    """Test several context keys are set in one step."""
+    context = {"phase": "draft"}
+    res = state_update.run({"values": {"phase": "review", "level": 2}}, context)
+    
+    assert res["status"] == "COMPLETED"
+    assert res["updated_keys"] == ["phase", "level"]
+    assert context == {"phase": "review", "level": 2}
+    assert state_update.run({"values": ["phase"]}, context)["status"] == "FAILED"
+
+class _TtyInput(io.StringIO):
+    """In-memory terminal: readable lines, isatty() True, no fileno for select()."""
+    def isatty(self):
+        return True
+
+def test_wait_cli_tty_confirms(monkeypatch):
+    """The TTY check happens per call; a terminal answer confirms."""
+    monkeypatch.setattr(sys, "stdin", _TtyInput("y\n"))
+    assert wait_cli.run({"message": "Go?"}, {})["status"] == "DONE"
+
+def test_wait_cli_piped_input_is_read(monkeypatch):
+    """Piped stdin with an answer present is read; an empty pipe does not block."""
+    import os
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(read_fd) as stdin, os.fdopen(write_fd, "w") as writer:
+        monkeypatch.setattr(sys, "stdin", stdin)
+        res = wait_cli.run({}, {})
+        assert res["status"] == "WAITING" and "Non-interactive" in res["message"]
+        
+        writer.write("y\n")
+        writer.flush()
+        assert wait_cli.run({}, {})["status"] == "DONE"
+
+def test_wait_cli_closed_stdin(monkeypatch):
+    """A missing, closed or exhausted stdin leaves the step waiting."""
+    monkeypatch.setattr(sys, "stdin", None)
+    assert wait_cli.run({}, {})["message"] == "Input stream closed."
+    
+    closed = io.StringIO()
+    closed.close()
+    monkeypatch.setattr(sys, "stdin", closed)
+    assert wait_cli.run({}, {})["message"] == "Input stream closed."
+    
+    monkeypatch.setattr(sys, "stdin", _TtyInput(""))
+    assert wait_cli.run({"timeout": 1}, {})["message"] == "Input stream closed."
+
+def test_wait_cli_timeout_without_select(monkeypatch):
+    """Streams select() cannot poll still honour the timeout; the pending read answers later."""
+    import threading
+    release = threading.Event()
+    class SlowTty(_TtyInput):
+        def readline(self, *a):
+            release.wait(5)
+            return "y\n"
+    monkeypatch.setattr(sys, "stdin", SlowTty())
+    
+    res = wait_cli.run({"timeout": 0.05}, {})
+    assert res == {"status": "WAITING", "message": "No answer yet."}
+    
+    release.set()
+    assert wait_cli.run({"timeout": 5}, {})["status"] == "DONE"
+
+@pytest.mark.parametrize("timeout", ["soon", -1, float("nan"), [1]])
+def test_wait_cli_invalid_timeout(timeout):
+    res = wait_cli.run({"timeout": timeout}, {})
+    assert res["status"] == "FAILED"
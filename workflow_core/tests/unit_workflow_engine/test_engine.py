@@ -78,7 +78,7 @@ def test_run_workflow_execution(mock_env):
     # Better to Mock the AtomExecutor.execute_step method.
     
     # MOCKING EXECUTION
-    def mock_exec(step, context):
+    def mock_exec(step, context, **resolved):
         return {"status": "DONE", "message": "Mock Success"}
         
     engine.executor.execute_step = mock_exec
@@ -88,3 +88,121 @@ def test_run_workflow_execution(mock_env):
     assert state_obj.task_id == "task_mock"
     assert state_obj.current_step_index == 1
     assert state_obj.steps_history["step1"].status == StateStatus.COMPLETED
+
+def test_parallel_steps_run_concurrently(mock_env):
+    """Test adjacent parallel steps run together and a blocked member is retried alone."""
+    import threading
+    config, state = mock_env
+    (config / "workflows" / "par_flow.json").write_text(json.dumps({
+        "name": "ParFlow",
+        "steps": [
+            {"id": "a", "type": "atom", "ref": "Render_Template", "parallel": True, "export": {"message": "a_out"}},
+            {"id": "b", "type": "atom", "ref": "Render_Template", "parallel": True, "export": {"message": "b_out"}},
+            {"id": "c", "type": "atom", "ref": "Render_Template", "args": {"x": "${a_out}+${b_out}"}}
+        ]
+    }))
+    engine = WorkflowEngine(config, state_root=state)
+    
+    # Both members must be in flight at once to pass the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    calls = []
+    blocked = {"b": True}
+    def mock_exec(step, context, resolved_args=None):
+        calls.append(step.id)
+        if step.id in ("a", "b") and len(calls) <= 2:
+            barrier.wait()
+        if step.id == "b" and blocked["b"]:
+            return {"status": "WAITING", "message": "not yet"}
+        return {"status": "DONE", "message": f"{step.id}-ok", "args": resolved_args}
+    engine.executor.execute_step = mock_exec
+    
+    first = engine.run_workflow("task_par", "ParFlow")
+    assert first.steps_history["a"].status == StateStatus.COMPLETED
+    assert first.steps_history["b"].status != StateStatus.COMPLETED
+    assert "c" not in first.steps_history
+    
+    blocked["b"] = False
+    second = engine.run_workflow("task_par", "ParFlow")
+    assert calls[2:] == ["b", "c"]
+    assert second.status == StateStatus.COMPLETED
+    assert second.steps_history["c"].output["args"] == {"x": "a-ok+b-ok"}
+
+def test_parallel_steps_get_private_context(mock_env):
+    """Test parallel members mutate their own context copy, merged in declaration order."""
+    config, state = mock_env
+    (config / "workflows" / "par_ctx_flow.json").write_text(json.dumps({
+        "name": "ParCtxFlow",
+        "steps": [
+            {"id": "a", "type": "atom", "ref": "Render_Template", "parallel": True},
+            {"id": "b", "type": "atom", "ref": "Render_Template", "parallel": True}
+        ]
+    }))
+    engine = WorkflowEngine(config, state_root=state)
+
+    seen = {}
+    def mock_exec(step, context, **resolved):
+        seen[step.id] = context
+        context[f"{step.id}_key"] = step.id
+        context["shared"] = step.id
+        return {"status": "DONE"}
+    engine.executor.execute_step = mock_exec
+
+    result = engine.run_workflow("task_par_ctx", "ParCtxFlow", {"shared": "init"})
+    assert seen["a"] is not seen["b"]
+    assert seen["a"] is not result.context_cache
+    assert "b_key" not in seen["a"] and "a_key" not in seen["b"]
+    assert result.context_cache["a_key"] == "a"
+    assert result.context_cache["b_key"] == "b"
+    assert result.context_cache["shared"] == "b"
+
+def test_cwd_reaches_atoms_but_not_context(mock_env, tmp_path, monkeypatch):
+    """Test atoms see the run's working directory while it stays out of the saved context."""
+    from workflow_core.engine.core.executor import current_cwd
+    config, state = mock_env
+    (config / "workflows" / "cwd_flow.json").write_text(json.dumps({
+        "name": "CwdFlow",
+        "steps": [{"id": "s", "type": "atom", "ref": "Render_Template", "args": {"p": "${_cwd}"}}]
+    }))
+    monkeypatch.chdir(tmp_path)
+    engine = WorkflowEngine(config, state_root=state)
+    seen = {}
+    def probe(args, context):
+        seen.update(cwd=current_cwd(), args=args, keys=set(context))
+        return {"status": "DONE"}
+    engine.executor._run_cache["Render_Template"] = probe
+
+    result = engine.run_workflow("task_cwd", "CwdFlow", {"_cwd": "/stale"})
+    assert seen["cwd"] == tmp_path
+    assert seen["args"] == {"p": "${_cwd}"}
+    assert "_cwd" not in seen["keys"] and "_cwd" not in result.context_cache
+    assert current_cwd() == tmp_path  # outside a step: the process directory
+
+def test_sub_workflow_completion(mock_env):
+    """Test a workflow step completes when its sub-workflow completes."""
+    config, state = mock_env
+    (config / "workflows" / "parent_flow.json").write_text(json.dumps({
+        "name": "ParentFlow",
+        "steps": [{"id": "child", "type": "workflow", "ref": "TestFlow"}]
+    }))
+    engine = WorkflowEngine(config, state_root=state)
+    results = iter([{"status": "WAITING", "message": "later"}, {"status": "DONE"}])
+    engine.executor.execute_step = lambda step, context, **resolved: next(results)
+    
+    first = engine.run_workflow("task_parent", "ParentFlow")
+    assert first.steps_history["child"].status != StateStatus.COMPLETED
+    
+    second = engine.run_workflow("task_parent", "ParentFlow")
+    assert second.steps_history["child"].status == StateStatus.COMPLETED
+    assert second.is_complete
+
+def test_teardown_errors_fail_workflow(mock_env):
+    """Test background failures reported at teardown (e.g. a git push) fail the saved state."""
+    config, state = mock_env
+    engine = WorkflowEngine(config, state_root=state)
+    engine.executor.execute_step = lambda step, context, **resolved: {"status": "DONE"}
+    engine.executor.finalize = lambda: ["Git push failed: no remote"]
+    
+    result = engine.run_workflow("task_teardown", "TestFlow")
+    assert result.status == StateStatus.FAILED
+    assert result.error == "Git push failed: no remote"
+    assert engine.persistence.load_state("task_teardown").error == "Git push failed: no remote"
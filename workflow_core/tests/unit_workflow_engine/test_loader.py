@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import pytest
 from pathlib import Path
 from workflow_core.engine.core.loader import WorkflowLoader
@@ -42,3 +43,43 @@ def test_load_non_existent():
     loader = WorkflowLoader(CONFIG_ROOT)
     with pytest.raises(FileNotFoundError):
         loader.load_workflow("Ghost_Flow")
+
+def test_index_prefers_internal_names(tmp_path):
+    """Verify internal names win over filename aliases and unparsable files are skipped."""
+    wf_dir = tmp_path / "workflows" / "sub"
+    wf_dir.mkdir(parents=True)
+    (wf_dir / "alpha.json").write_text('{"name": "Flow.Alpha", "steps": []}', encoding="utf-8")
+    (wf_dir / "beta.json").write_text('{"name": "alpha", "steps": []}', encoding="utf-8")
+    (wf_dir / "broken.json").write_text('{not json', encoding="utf-8")
+    
+    loader = WorkflowLoader(tmp_path)
+    assert loader.load_workflow("alpha").name == "alpha"
+    assert loader.load_workflow("Flow.Alpha").name == "Flow.Alpha"
+    with pytest.raises(FileNotFoundError):
+        loader.load_workflow("broken")
+
+def test_duplicate_name_last_file_wins(tmp_path):
+    """Verify a name declared by several files resolves to the last one scanned, as the eager index did."""
+    wf_dir = tmp_path / "workflows"
+    wf_dir.mkdir()
+    for stem in ("one", "two", "three"):
+        (wf_dir / f"{stem}.json").write_text(
+            json.dumps({"name": "Dup", "version": stem, "steps": []}), encoding="utf-8"
+        )
+    last = list(wf_dir.rglob("*.json"))[-1]
+    
+    assert WorkflowLoader(tmp_path).load_workflow("Dup").version == last.stem
+
+def test_concurrent_loads_find_every_workflow(tmp_path):
+    """Verify parallel callers all resolve their workflow."""
+    from concurrent.futures import ThreadPoolExecutor
+    wf_dir = tmp_path / "workflows"
+    wf_dir.mkdir()
+    names = [f"Flow.{i}" for i in range(40)]
+    for i, name in enumerate(names):
+        (wf_dir / f"f{i}.json").write_text(json.dumps({"name": name, "steps": []}), encoding="utf-8")
+    
+    loader = WorkflowLoader(tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        loaded = list(pool.map(lambda n: loader.load_workflow(n).name, names))
+    assert loaded == names
@@ -57,3 +57,14 @@ def test_workflow_step_missing_ref():
     }
     with pytest.raises(ValidationError):
         WorkflowStep(**data)
+
+def test_step_state_timestamps_round_trip():
+    """Test timestamps are kept as ns in memory and as ISO strings on disk."""
+    from workflow_core.engine.schemas.models import StepState
+    iso = "2026-01-02T03:04:05.678901+00:00"
+    state = StepState(step_id="s1", started_at=iso)
+    assert state.started_at == 1767323045678901000
+    
+    dumped = state.model_dump_json()
+    assert f'"started_at":"{iso}"' in dumped
+    assert StepState.model_validate_json(dumped).started_at == state.started_at
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import pytest
 from pathlib import Path
 from workflow_core.engine.core.state import PersistenceManager
@@ -56,3 +57,70 @@ def test_corrupt_state_raises(temp_state_dir):
     
     with pytest.raises(ValueError):
         pm.load_state("bad")
+
+def test_unchanged_state_not_rewritten(temp_state_dir):
+    """Saving an identical state again leaves the file untouched."""
+    pm = PersistenceManager(temp_state_dir)
+    state = WorkflowState(task_id="1.2.3", workflow_ref="TestFlow")
+    pm.save_state(state)
+    
+    # Any rewrite would move the mtime off this marker
+    path = temp_state_dir / ".flow_state" / "1_2_3.state.json"
+    os.utime(path, ns=(0, 0))
+    
+    pm.save_state(pm.load_state("1.2.3"))
+    assert path.stat().st_mtime_ns == 0
+    
+    state.current_step_index = 1
+    pm.save_state(state)
+    assert path.stat().st_mtime_ns != 0
+    assert pm.load_state("1.2.3").current_step_index == 1
+
+def test_trusted_load_matches_strict(temp_state_dir):
+    """Loading without validation yields the same state as a validated load."""
+    from workflow_core.engine.schemas.models import StepState, StateStatus
+    pm = PersistenceManager(temp_state_dir)
+    state = WorkflowState(
+        task_id="1.2.3",
+        workflow_ref="TestFlow",
+        status=StateStatus.IN_PROGRESS,
+        steps_history={"s1": StepState(step_id="s1", status=StateStatus.COMPLETED,
+                                       output={"k": [1]}, started_at=1_700_000_000_123_456_000)},
+        context_cache={"a": {"b": 1}}
+    )
+    pm.save_state(state)
+    
+    trusted = pm.load_state("1.2.3")
+    assert trusted == pm.load_state("1.2.3", strict=True)
+    assert trusted.steps_history["s1"].status is StateStatus.COMPLETED
+    assert trusted.model_dump_json() == state.model_dump_json()
+
+def test_trusted_load_missing_field_raises(temp_state_dir):
+    """A state file missing required fields is still reported as corrupt."""
+    pm = PersistenceManager(temp_state_dir)
+    bad_file = temp_state_dir / ".flow_state" / "bad.state.json"
+    bad_file.write_text('{"task_id": "bad"}')
+    
+    with pytest.raises(ValueError):
+        pm.load_state("bad")
+
+def test_strict_load_corrupt_json_raises(temp_state_dir):
+    """Strict loading reports invalid JSON as a corrupt state file too."""
+    pm = PersistenceManager(temp_state_dir)
+    bad_file = temp_state_dir / ".flow_state" / "bad.state.json"
+    bad_file.write_text("{ NOT JSON }")
+    
+    with pytest.raises(ValueError, match="Corrupt State File"):
+        pm.load_state("bad", strict=True)
+
+def test_save_replaces_file_atomically(temp_state_dir):
+    """The state file is swapped in whole; no temp file is left behind."""
+    pm = PersistenceManager(temp_state_dir)
+    path = temp_state_dir / ".flow_state" / "1_2_3.state.json"
+    pm.save_state(WorkflowState(task_id="1.2.3", workflow_ref="TestFlow"))
+    inode = path.stat().st_ino
+    
+    pm.save_state(WorkflowState(task_id="1.2.3", workflow_ref="TestFlow", current_step_index=2))
+    assert path.stat().st_ino != inode
+    assert [p.name for p in path.parent.iterdir()] == ["1_2_3.state.json"]
+    assert pm.load_state("1.2.3").current_step_index == 2